@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+NeetCode bundle extraction benchmark: streaming tokenizer vs. the old regex
+
+Runs both extractors on captured bundles (or a synthetic multi-megabyte bundle
+when none are given) and reports the time, peak traced memory and number of
+records each one finds.
+
+    python benchmarks/bundle_extract_bench.py path/to/main.js [more bundles...]
+"""
+import os
+import re
+import sys
+import time
+import argparse
+import tempfile
+import tracemalloc
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from src.scrapers.bundle_extractor import iter_problem_records
+
+# The pattern fetch_from_frontend used before the streaming extractor
+LEGACY_PATTERN = r'\[{id:"([^"]*)",title:"([^"]*)",difficulty:"([^"]*)",category:"([^"]*)",order:\d+,videoId:"([^"]*)",link:"([^"]*)",premium:([^,]*),neetCode:true'
+
+CHUNK_SIZE = 64 * 1024
+
+
+def synthetic_bundle(path, size_mb, records=150):
+    """Write a minified-looking bundle of about size_mb megabytes with problem records spread through it"""
+    filler = 'function f(a,b){return a.map(function(c){return{id:c.id,v:"x".repeat(b)}})};var o={id:"x",n:1};'
+    chunks_between = max(1, int(size_mb * 1024 * 1024 / len(filler) / records))
+    with open(path, 'w') as f:
+        for i in range(records):
+            f.write(filler * chunks_between)
+            f.write(f'var p{i}=[{{id:"{i}",title:"Problem {i}",difficulty:"Medium",category:"Arrays & Hashing",'
+                    f'order:{i},videoId:"vid{i}",link:"problem-{i}",premium:false,neetCode:true,blind75:false}}];')
+
+
+def run_regex(path):
+    with open(path, 'rb') as f:
+        text = f.read().decode('utf-8', errors='replace')
+    return len(re.findall(LEGACY_PATTERN, text))
+
+
+def run_streaming(path):
+    def chunks():
+        with open(path, 'rb') as f:
+            while True:
+                chunk = f.read(CHUNK_SIZE)
+                if not chunk:
+                    return
+                yield chunk
+    return sum(1 for _ in iter_problem_records(chunks()))
+
+
+def measure(extract, path):
+    tracemalloc.start()
+    start = time.perf_counter()
+    found = extract(path)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, found
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare the streaming bundle extractor with the old regex')
+    parser.add_argument('bundles', nargs='*', help='Captured main.js bundles (default: a synthetic bundle)')
+    parser.add_argument('--size-mb', type=float, default=5.0, help='Size of the synthetic bundle (default: 5)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        bundles = args.bundles
+        if not bundles:
+            bundles = [os.path.join(tmp_dir, 'synthetic_main.js')]
+            synthetic_bundle(bundles[0], args.size_mb)
+
+        print(f"{'bundle':<24} {'extractor':<10} {'time (ms)':>10} {'peak (KB)':>10} {'records':>8}")
+        for path in bundles:
+            size_mb = os.path.getsize(path) / (1024 * 1024)
+            label = f"{os.path.basename(path)[:15]} ({size_mb:.1f}MB)"
+            for name, extract in (('regex', run_regex), ('streaming', run_streaming)):
+                elapsed, peak, found = measure(extract, path)
+                print(f"{label:<24} {name:<10} {elapsed * 1000:>10.1f} {peak / 1024:>10.0f} {found:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Catalog loading benchmark: bundled JSON data file vs. dict literals in the module
+
+neetcode_scraper.py used to carry the NeetCode 150 catalog as dict literals,
+which Python had to compile (or unmarshal from the .pyc) on every import. This
+rebuilds that literal version of the module from the data file and compares
+importing both versions, with and without cached bytecode, and building the
+catalog from each.
+
+    python benchmarks/catalog_load_bench.py --runs 50
+"""
+import os
+import sys
+import time
+import marshal
+import argparse
+import statistics
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+# Third-party imports are shared by both versions, load them up front so only the module's own cost is timed
+import pandas  # noqa: F401
+import requests  # noqa: F401
+
+from src.scrapers import neetcode_scraper
+
+SCRAPER_PATH = neetcode_scraper.__file__
+
+
+def literal_module_source():
+    """The scraper source with the catalog added back as a function returning dict literals"""
+    with open(SCRAPER_PATH, 'r') as f:
+        source = f.read()
+    neetcode_scraper._catalog = None
+    rows = ',\n'.join(f"        {question!r}" for question in neetcode_scraper.load_catalog()['questions'])
+    return source + f"\n\ndef literal_catalog():\n    return [\n{rows},\n    ]\n"
+
+
+def median_ms(fn, runs):
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare loading the catalog from JSON and from dict literals')
+    parser.add_argument('--runs', type=int, default=50, help='Runs per measurement (default: 50)')
+    args = parser.parse_args()
+
+    with open(SCRAPER_PATH, 'r') as f:
+        sources = {'data file': f.read(), 'dict literals': literal_module_source()}
+
+    print(f"{'module':<14} {'size (KB)':>10} {'compile (ms)':>13} {'import .pyc (ms)':>17} {'catalog (ms)':>13}")
+    for name, source in sources.items():
+        code = compile(source, SCRAPER_PATH, 'exec')
+        pyc = marshal.dumps(code)
+
+        compile_ms = median_ms(lambda: compile(source, SCRAPER_PATH, 'exec'), args.runs)
+        # Importing with cached bytecode: unmarshal the code object and run the module body
+        import_ms = median_ms(lambda: exec(marshal.loads(pyc), {'__name__': 'bench', '__file__': SCRAPER_PATH}),
+                              args.runs)
+
+        namespace = {'__name__': 'bench', '__file__': SCRAPER_PATH}
+        exec(code, namespace)
+        if name == 'data file':
+            def build():
+                namespace['_catalog'] = None
+                namespace['load_catalog']()
+        else:
+            build = namespace['literal_catalog']
+        catalog_ms = median_ms(build, args.runs)
+
+        print(f"{name:<14} {len(source.encode()) / 1024:>10.1f} {compile_ms:>13.2f} {import_ms:>17.3f} {catalog_ms:>13.3f}")
+
+    cached_ms = median_ms(neetcode_scraper.load_catalog, args.runs)
+    print(f"\nload_catalog() after the first call: {cached_ms * 1000:.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
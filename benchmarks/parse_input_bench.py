@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Input parsing benchmark: linear tokenizer and JSON fast path vs. the old character loop
+
+Parses generated example inputs with 10^3 to 10^5 elements with the current
+TestCaseGenerator.parse_input_string and with the version it replaced, which
+built each part one character at a time, only tracked [ and ] and ran
+ast.literal_eval on every part.
+
+    python benchmarks/parse_input_bench.py --max-size 100000
+"""
+import os
+import ast
+import sys
+import time
+import argparse
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from src.utils.test_case_generator import TestCaseGenerator
+
+
+def legacy_parse_input_string(input_str):
+    """parse_input_string as it was before the tokenizer"""
+    def parse_single_value(value_str):
+        try:
+            return ast.literal_eval(value_str)
+        except (SyntaxError, ValueError):
+            return value_str.strip()
+
+    if ',' not in input_str:
+        return parse_single_value(input_str)
+    parts = []
+    current_part = ""
+    bracket_count = 0
+    for char in input_str:
+        if char == '[':
+            bracket_count += 1
+            current_part += char
+        elif char == ']':
+            bracket_count -= 1
+            current_part += char
+        elif char == ',' and bracket_count == 0:
+            parts.append(current_part.strip())
+            current_part = ""
+        else:
+            current_part += char
+    if current_part:
+        parts.append(current_part.strip())
+    parsed_parts = []
+    for part in parts:
+        if '=' in part:
+            part = part.split('=', 1)[1]
+        parsed_parts.append(parse_single_value(part.strip()))
+    return tuple(parsed_parts)
+
+
+# Input shapes, each a function of the number of elements
+SHAPES = {
+    'numbers': lambda n: f"nums = [{','.join(str(i * 7 % 1000 - 500) for i in range(n))}], target = 9",
+    'strings': lambda n: f"words = [{','.join(f'{chr(34)}w{i}{chr(34)}' for i in range(n))}], k = 3",
+    'pairs': lambda n: f"intervals = [{','.join(f'[{i},{i + 2}]' for i in range(n))}]",
+    'grid': lambda n: "grid = [" + ','.join('[' + ','.join('"1"' if (r + c) % 3 else '"0"' for c in range(100)) + ']'
+                                           for r in range(max(1, n // 100))) + "]",
+}
+
+
+def time_ms(parse, text, runs):
+    best = float('inf')
+    for _ in range(runs):
+        start = time.perf_counter()
+        parse(text)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare input parsing with the old character loop')
+    parser.add_argument('--max-size', type=int, default=100000, help='Largest number of elements (default: 100000)')
+    parser.add_argument('--runs', type=int, default=3, help='Runs per measurement, the best is reported (default: 3)')
+    args = parser.parse_args()
+
+    sizes = [size for size in (1000, 10000, 100000, 1000000) if size <= args.max_size]
+    print(f"{'shape':<8} {'elements':>9} {'size (KB)':>10} {'old (ms)':>10} {'new (ms)':>10} {'speedup':>8}")
+    for shape, make_input in SHAPES.items():
+        for size in sizes:
+            text = make_input(size)
+            new_ms = time_ms(TestCaseGenerator.parse_input_string, text, args.runs)
+            old_ms = time_ms(legacy_parse_input_string, text, args.runs)
+            if TestCaseGenerator.parse_input_string(text) != legacy_parse_input_string(text):
+                print(f"  {shape} with {size} elements parses differently from the old version")
+            print(f"{shape:<8} {size:>9} {len(text) / 1024:>10.0f} {old_ms:>10.1f} {new_ms:>10.2f} "
+                  f"{old_ms / new_ms:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
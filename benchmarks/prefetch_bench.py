@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Description prefetch benchmark against a local stand-in GraphQL server
+
+Starts a server that answers LeetCode's questionData query after a fixed
+latency, then fetches the same catalog one request at a time and through the
+pooled, rate-limited client used by --prefetch.
+
+    python benchmarks/prefetch_bench.py --questions 150 --latency 0.1
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from src.scrapers.leetcode_client import LeetCodeClient
+
+
+def make_handler(latency, connections):
+    class StandInHandler(BaseHTTPRequestHandler):
+        # Keep-alive, like the real endpoint
+        protocol_version = 'HTTP/1.1'
+        # Send headers and body in one write so delayed ACKs don't add latency
+        wbufsize = -1
+
+        def setup(self):
+            super().setup()
+            connections.append(self.client_address)
+
+        def do_POST(self):
+            request = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+            slug = request['variables']['titleSlug']
+            time.sleep(latency)
+            body = json.dumps({'data': {'question': {
+                'title': slug.replace('-', ' ').title(),
+                'content': f"<p>Description of {slug}</p>",
+                'exampleTestcases': "[1,2,3]\n6",
+                'difficulty': 'Easy'
+            }}}).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return StandInHandler
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark --prefetch against a local stand-in server')
+    parser.add_argument('--questions', type=int, default=150, help='Number of problems to fetch (default: 150)')
+    parser.add_argument('--latency', type=float, default=0.1, help='Server latency per request in seconds')
+    parser.add_argument('--workers', type=int, default=8, help='Connections for the pooled client (default: 8)')
+    parser.add_argument('--rate', type=float, default=50.0, help='Requests per second for the pooled client')
+    args = parser.parse_args()
+
+    connections = []
+    server = ThreadingHTTPServer(('127.0.0.1', 0), make_handler(args.latency, connections))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/graphql"
+    slugs = [f"problem-{i}" for i in range(args.questions)]
+
+    try:
+        print(f"{'client':<28} {'time (s)':>9} {'fetched':>8} {'connections':>12}")
+        for label, client in [
+            ('serial', LeetCodeClient(url, max_connections=1, rate=0)),
+            (f'pooled x{args.workers} @ {args.rate:g}/s', LeetCodeClient(url, max_connections=args.workers, rate=args.rate)),
+        ]:
+            connections.clear()
+            start = time.perf_counter()
+            fetched = client.fetch_questions(slugs)
+            elapsed = time.perf_counter() - start
+            print(f"{label:<28} {elapsed:>9.2f} {len(fetched):>8} {len(connections):>12}")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Startup time budget for the main.py CLI
+
+Runs each command several times in a fresh interpreter, reports the median
+wall-clock time and exits non-zero if any command is over its budget.
+
+    python benchmarks/startup_budget.py --runs 10
+"""
+import os
+import sys
+import argparse
+import statistics
+import subprocess
+import tempfile
+import time
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAIN_PATH = os.path.join(project_root, "main.py")
+
+# A solution whose tests fail, so timing --test never writes to questions.csv
+PROBE_SOLUTION = '''
+class Solution:
+    def solution_function(self, nums):
+        return -1
+
+    def get_test_cases(self):
+        return [([1, 2, 3], 6)]
+'''
+
+# Median wall-clock budget per command in milliseconds
+BUDGETS_MS = {
+    ('--help',): 150,
+    ('--stop-daemon',): 150,
+    ('--push-status',): 150,
+    ('--test', '{probe}', '--no-daemon'): 300,
+    ('--status', '--no-daemon'): 1000,
+}
+
+
+def time_command(args, runs):
+    """Return the wall-clock times of running main.py with args, in milliseconds"""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, MAIN_PATH] + list(args), cwd=project_root,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check main.py startup time against per-command budgets')
+    parser.add_argument('--runs', type=int, default=5, help='Runs per command (default: 5)')
+    args = parser.parse_args()
+
+    over_budget = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        probe_path = os.path.join(tmp_dir, "startup_probe_solution.py")
+        with open(probe_path, 'w') as f:
+            f.write(PROBE_SOLUTION)
+
+        print(f"{'command':<40} {'median (ms)':>12} {'budget (ms)':>12}")
+        for command, budget_ms in BUDGETS_MS.items():
+            command_args = [arg.format(probe=probe_path) for arg in command]
+            median_ms = statistics.median(time_command(command_args, args.runs))
+            label = ' '.join(arg if arg != '{probe}' else '<probe>' for arg in command)
+            status = 'ok' if median_ms <= budget_ms else 'OVER BUDGET'
+            print(f"{label:<40} {median_ms:>12.0f} {budget_ms:>12}  {status}")
+            if median_ms > budget_ms:
+                over_budget.append(label)
+
+    if over_budget:
+        print(f"\n{len(over_budget)} command(s) over budget: {', '.join(over_budget)}")
+        sys.exit(1)
+    print("\nAll commands within budget")
+
+
+if __name__ == "__main__":
+    main()
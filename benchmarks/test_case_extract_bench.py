@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Example extraction benchmark: single-pass HTML parser vs. the old regexes
+
+Runs both extractors over a description for every problem in the catalog and
+reports the time, how many examples each one finds and how many of those are
+clean, with no tags or entities left in the values.
+
+Stored descriptions (from --prefetch) are used when there are any, otherwise
+synthetic descriptions are generated in both LeetCode markups: the older
+<pre> blocks and the newer <span class="example-io"> example blocks with
+&quot; entities.
+
+    python benchmarks/test_case_extract_bench.py --runs 5
+"""
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import statistics
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(project_root)
+
+from src.scrapers.neetcode_scraper import load_catalog
+from src.scrapers.leetcode_client import DescriptionStore
+from src.utils.test_case_generator import TestCaseGenerator
+
+DESCRIPTIONS_DIR = os.path.join(project_root, "descriptions")
+
+EXAMPLES_PER_PROBLEM = 3
+
+# Leftover tags or entities in an extracted value, which make it unparseable
+UNCLEAN = re.compile(r'<[^>]*>|&[#\w]+;')
+
+
+def legacy_extract(description):
+    """extract_examples_from_description as it was before the HTML parser"""
+    examples = []
+    input_matches = (re.findall(r"<strong>Input:</strong>.*?</strong>", description) or
+                     re.findall(r"Input:.*?\n", description))
+    output_matches = (re.findall(r"<strong>Output:</strong>.*?</strong>", description) or
+                      re.findall(r"Output:.*?\n", description))
+    for input_match, output_match in zip(input_matches, output_matches):
+        input_text = re.sub(r"<.*?>", "", input_match.split("Input:")[1].strip()).strip()
+        output_text = re.sub(r"<.*?>", "", output_match.split("Output:")[1].strip()).strip()
+        examples.append({'input': input_text, 'output': output_text})
+    return examples
+
+
+def synthetic_description(index, slug):
+    """A description of a catalog problem, alternating between the old and the new markup"""
+    parts = [f"<p>Solve <code>{slug}</code>. Given <code>nums</code> and <code>s</code>, return the answer.</p>"]
+    for example in range(1, EXAMPLES_PER_PROBLEM + 1):
+        nums = ','.join(str((index * 7 + example * 3 + i) % 100) for i in range(example * 4))
+        word = f"{slug[:6]}&amp;{example}"
+        parts.append(f'<p><strong class="example">Example {example}:</strong></p>')
+        if index % 2:
+            parts.append(
+                '<div class="example-block">\n'
+                f'<p><strong>Input:</strong> <span class="example-io">nums = [{nums}], '
+                f's = &quot;{word}&quot;</span></p>\n'
+                f'<p><strong>Output:</strong> <span class="example-io">{example}</span></p>\n'
+                f'<p><strong>Explanation:</strong></p>\n<ul><li>Step {example}.</li></ul>\n</div>'
+            )
+        else:
+            parts.append(
+                f'<pre>\n<strong>Input:</strong> nums = [{nums}], s = &quot;{word}&quot;\n'
+                f'<strong>Output:</strong> {example}\n'
+                f'<strong>Explanation:</strong> Step {example}.\n</pre>'
+            )
+    parts.append("<p><strong>Constraints:</strong></p><ul><li><code>1 &lt;= nums.length &lt;= 10<sup>5</sup></code></li></ul>")
+    return '\n'.join(parts)
+
+
+def load_descriptions():
+    """Stored descriptions if there are any, otherwise synthetic ones for the whole catalog"""
+    store = DescriptionStore(DESCRIPTIONS_DIR)
+    stored = {}
+    for slug in store.slugs():
+        question = store.get(slug)
+        if question and question.get('content'):
+            stored[slug] = question['content']
+    if stored:
+        return 'stored', stored
+    questions = load_catalog()['questions']
+    return 'synthetic', {question['id']: synthetic_description(i, question['id'])
+                         for i, question in enumerate(questions)}
+
+
+def run(extract, descriptions):
+    """Extract every description and parse its examples, returning (examples found, clean examples)"""
+    examples = 0
+    clean = 0
+    for description in descriptions.values():
+        found = extract(description)
+        examples += len(found)
+        for example in found:
+            TestCaseGenerator.parse_input_string(example['input'])
+            TestCaseGenerator.parse_output_string(example['output'])
+            if not UNCLEAN.search(example['input']) and not UNCLEAN.search(example['output']):
+                clean += 1
+    return examples, clean
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare the HTML example extractor with the old regexes')
+    parser.add_argument('--runs', type=int, default=5, help='Runs per extractor (default: 5)')
+    parser.add_argument('--output', type=str, default=None, help='Write the results as JSON to this file')
+    args = parser.parse_args()
+
+    source, descriptions = load_descriptions()
+    size_kb = sum(len(description.encode()) for description in descriptions.values()) / 1024
+    print(f"{len(descriptions)} {source} descriptions, {size_kb:.0f} KB\n")
+
+    extractors = {
+        'regex': legacy_extract,
+        'html parser': TestCaseGenerator.extract_examples_from_description,
+    }
+    results = {}
+    print(f"{'extractor':<12} {'median (ms)':>12} {'per problem (µs)':>17} {'examples':>9} {'clean':>6} {'problems':>9}")
+    for name, extract in extractors.items():
+        timings = []
+        for _ in range(args.runs):
+            start = time.perf_counter()
+            examples, clean = run(extract, descriptions)
+            timings.append((time.perf_counter() - start) * 1000)
+        with_examples = sum(1 for description in descriptions.values() if extract(description))
+        median_ms = statistics.median(timings)
+        results[name] = {'median_ms': median_ms, 'examples': examples, 'clean_examples': clean,
+                         'problems_with_examples': with_examples}
+        print(f"{name:<12} {median_ms:>12.2f} {median_ms * 1000 / len(descriptions):>17.1f} "
+              f"{examples:>9} {clean:>6} {with_examples:>5}/{len(descriptions)}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({'source': source, 'problems': len(descriptions), 'results': results}, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
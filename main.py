@@ -2,11 +2,9 @@
 import os
 import sys
 import argparse
+import glob
 from datetime import datetime
 import string
-import re
-import requests
-import importlib
 
 # Ensure correct paths - use absolute path to the current script's directory
 script_path = os.path.abspath(__file__)
@@ -16,16 +14,31 @@ project_root = script_dir  # Set project_root to the current directory
 # Add project_root to system path
 sys.path.append(project_root)
 
-# Import modules from correct paths
-from src.scrapers.neetcode_scraper import fetch_neetcode_questions
-from src.scrapers.csv_handler import CSVHandler
-from src.scrapers.git_handler import GitHandler
-from src.utils.solution_tester import SolutionTester
+# Modules from src/ (and the pandas, requests and GitPython they pull in)
+# are imported inside the commands that use them to keep CLI startup fast
 
 # Constants
 CSV_PATH = os.path.join(project_root, "questions.csv")
+DB_PATH = os.path.join(project_root, "questions.db")
 SOLUTIONS_DIR = os.path.join(project_root, "questions")
 TEMPLATE_PATH = os.path.join(project_root, "src", "templates", "solution_template.py")
+DAEMON_SOCKET = os.path.join(project_root, ".dsa_daemon.sock")
+INDEX_PATH = os.path.join(project_root, "solution_index.json")
+SCHEDULE_PATH = os.path.join(project_root, "schedule.json")
+DESCRIPTIONS_DIR = os.path.join(project_root, "descriptions")
+HTTP_CACHE_DIR = os.path.join(project_root, ".http_cache")
+CATALOG_DIR = os.path.join(project_root, "catalog")
+PUSH_QUEUE_PATH = os.path.join(project_root, ".push_queue.json")
+VERDICT_CACHE_DIR = os.path.join(project_root, ".verdict_cache")
+GENERATED_TESTS_PATH = os.path.join(project_root, "generated_test_cases.json")
+
+# What --commit stages: solution files and the tracking files the CLI writes
+COMMIT_PATTERNS = ['questions/*', 'questions.csv', 'questions.db', 'solution_index.json',
+                   'schedule.json', 'catalog/*']
+
+_solution_index = None
+_scheduler = None
+_storages = {}
 
 
 def sanitize_filename(filename):
@@ -36,40 +49,38 @@ def sanitize_filename(filename):
     return filename.lower()
 
 
-def fetch_problem_description(url):
-    """Try to fetch a problem description from LeetCode URL"""
+def get_http_cache(mode=None):
+    """Return the on-disk HTTP response cache in the given mode (normal, cache-only or refresh)"""
+    from src.utils.http_cache import HTTPCache, NORMAL
+    return HTTPCache(HTTP_CACHE_DIR, mode or NORMAL)
+
+
+def fetch_problem_description(url, graphql_url=None, cache=None):
+    """Try to fetch a problem description from LeetCode URL, using the prefetched copy if there is one"""
     # This is a simplified implementation and may not work for all problems
     # LeetCode has anti-scraping measures
+    from src.scrapers.leetcode_client import LeetCodeClient, DescriptionStore, problem_slug
+    
     try:
-        problem_slug = url.strip('/').split('/')[-1]
-        leetcode_api = f"https://leetcode.com/graphql"
-        query = """
-        query questionData($titleSlug: String!) {
-            question(titleSlug: $titleSlug) {
-                title
-                content
-                exampleTestcases
-                difficulty
-            }
-        }
-        """
-        response = requests.post(leetcode_api, json={
-            'query': query,
-            'variables': {'titleSlug': problem_slug}
-        })
-        data = response.json()
-        question_data = data.get('data', {}).get('question', {})
+        slug = problem_slug(url)
+        store = DescriptionStore(DESCRIPTIONS_DIR)
+        refresh = cache is not None and cache.mode == 'refresh'
+        question_data = None if refresh else store.get(slug)
+        if question_data is None:
+            client = LeetCodeClient(graphql_url, max_connections=1, rate=0, cache=cache)
+            question_data = client.fetch_question(slug)
+            store.put(slug, question_data)
         
         # Process examples to ensure they don't contain format strings
-        examples = question_data.get('exampleTestcases', '')
+        examples = question_data.get('exampleTestcases') or ''
         # Escape any curly braces to prevent format string issues
         examples = examples.replace('{', '{{').replace('}', '}}')
         
         return {
-            'title': question_data.get('title', ''),
-            'description': question_data.get('content', '').replace('{', '{{').replace('}', '}}'),
+            'title': question_data.get('title') or '',
+            'description': (question_data.get('content') or '').replace('{', '{{').replace('}', '}}'),
             'examples': examples,
-            'difficulty': question_data.get('difficulty', '')
+            'difficulty': question_data.get('difficulty') or ''
         }
     except Exception as e:
         print(f"Failed to fetch problem description: {e}")
@@ -81,21 +92,123 @@ def fetch_problem_description(url):
         }
 
 
-def create_solution_file(question, template_path, solutions_dir):
-    """Create a solution file from template"""
-    # Create directory structure
-    category_dir = os.path.join(solutions_dir, sanitize_filename(question['category']))
-    difficulty_dir = os.path.join(category_dir, question['difficulty'].lower())
+def prefetch_descriptions(storage, graphql_url=None, workers=8, rate=5.0, cache=None):
+    """
+    Fetch the descriptions of every question in the catalog concurrently and store them locally
+    
+    Returns:
+        int: Number of descriptions fetched
+    """
+    import time
+    from src.scrapers.leetcode_client import LeetCodeClient, DescriptionStore, problem_slug
+    
+    store = DescriptionStore(DESCRIPTIONS_DIR)
+    refresh = cache is not None and cache.mode == 'refresh'
+    slugs = list(dict.fromkeys(problem_slug(url) for url in storage.read_questions().get('url', [])))
+    missing = slugs if refresh else [slug for slug in slugs if slug not in store]
+    print(f"Prefetching {len(missing)} descriptions ({len(slugs) - len(missing)} already stored)")
+    if not missing:
+        return 0
+    
+    failures = []
+    
+    def on_result(slug, question, error):
+        if error is not None:
+            failures.append(slug)
+            print(f"  {slug}: {error}")
+        else:
+            store.put(slug, question)
+    
+    client = LeetCodeClient(graphql_url, max_connections=workers, rate=rate, cache=cache)
+    start = time.perf_counter()
+    fetched = client.fetch_questions(missing, on_result=on_result)
+    print(f"Fetched {len(fetched)} descriptions in {time.perf_counter() - start:.1f}s, "
+          f"{len(failures)} failed, stored in {DESCRIPTIONS_DIR}")
+    return len(fetched)
+
+
+def generate_all_test_cases(output_path):
+    """
+    Generate test cases from the examples of every stored description and write them to a JSON file
     
-    os.makedirs(difficulty_dir, exist_ok=True)
+    Returns:
+        int: Number of problems test cases were generated for
+    """
+    import json
+    from src.scrapers.leetcode_client import DescriptionStore
+    from src.utils.test_case_generator import TestCaseGenerator
     
-    # Generate filename
+    store = DescriptionStore(DESCRIPTIONS_DIR)
+    descriptions = {}
+    for slug in store.slugs():
+        question = store.get(slug)
+        if question and question.get('content'):
+            descriptions[slug] = question['content']
+    if not descriptions:
+        print("No stored descriptions. Run --prefetch first.")
+        return 0
+    
+    test_cases = TestCaseGenerator.generate_test_cases_batch(descriptions)
+    total = sum(len(cases) for cases in test_cases.values())
+    print(f"Generated {total} test cases for {len(test_cases)} of {len(descriptions)} problems")
+    missing = sorted(set(descriptions) - set(test_cases))
+    if missing:
+        print(f"No examples found for: {', '.join(missing[:10])}{' ...' if len(missing) > 10 else ''}")
+    
+    # One problem per line, tuples of inputs are written as JSON arrays
+    with open(output_path, 'w') as f:
+        lines = [f"  {json.dumps(slug)}: {json.dumps([[inputs, expected] for inputs, expected in cases])}"
+                 for slug, cases in test_cases.items()]
+        f.write("{\n" + ",\n".join(lines) + "\n}\n")
+    print(f"Test cases written to {output_path}")
+    return len(test_cases)
+
+
+def get_solution_index():
+    """Return the solution path -> question ID index, loading it on first use"""
+    global _solution_index
+    if _solution_index is None:
+        from src.utils.solution_index import SolutionIndex
+        _solution_index = SolutionIndex(INDEX_PATH, project_root)
+    return _solution_index
+
+
+def get_scheduler(storage, sync=True):
+    """
+    Return the review scheduler, synced with the tracked questions whenever the
+    tracking file changed since the last sync (sync=False skips the catalog read)
+    """
+    global _scheduler
+    if _scheduler is None:
+        from src.utils.scheduler import ReviewScheduler
+        _scheduler = ReviewScheduler(SCHEDULE_PATH)
+    else:
+        _scheduler.reload_if_changed()
+    if sync:
+        signature = storage.file_signature()
+        if len(_scheduler) == 0 or _scheduler.synced_with != (list(signature) if signature else None):
+            _scheduler.sync(storage.read_questions(), signature)
+    return _scheduler
+
+
+def solution_path_for(question, solutions_dir):
+    """Return the path of the solution file for a question"""
+    category_dir = os.path.join(solutions_dir, sanitize_filename(question['category']))
+    difficulty_dir = os.path.join(category_dir, question['difficulty'].lower())
     filename = f"{sanitize_filename(question['title'])}_solution.py"
-    solution_path = os.path.join(difficulty_dir, filename)
+    return os.path.join(difficulty_dir, filename)
+
+
+def create_solution_file(question, template_path, solutions_dir, graphql_url=None, cache=None):
+    """Create a solution file from template"""
+    # Create directory structure
+    solution_path = solution_path_for(question, solutions_dir)
+    os.makedirs(os.path.dirname(solution_path), exist_ok=True)
     
     # Check if file already exists
     if os.path.exists(solution_path):
         print(f"Solution file already exists at {solution_path}")
+        get_solution_index().add(solution_path, question['id'])
         return solution_path
     
     # Create a default description if LeetCode API fails
@@ -104,7 +217,7 @@ def create_solution_file(question, template_path, solutions_dir):
     
     try:
         # Try to fetch problem details, but don't fail if it doesn't work
-        problem_details = fetch_problem_description(question['url'])
+        problem_details = fetch_problem_description(question['url'], graphql_url, cache)
         if problem_details.get('description') and problem_details['description'] != 'Unable to fetch problem description automatically.':
             description = problem_details['description']
         if problem_details.get('examples') and problem_details['examples'] != 'Please add examples manually.':
@@ -134,11 +247,293 @@ def create_solution_file(question, template_path, solutions_dir):
     # Write solution file
     with open(solution_path, 'w') as file:
         file.write(solution_content)
+    get_solution_index().add(solution_path, question['id'])
     
     print(f"Created solution file at {solution_path}")
     return solution_path
 
 
+def find_solution_files(solutions_dir, category=None, difficulty=None):
+    """Find all solution files, optionally filtered by category and difficulty"""
+    category_dir = sanitize_filename(category) if category else '*'
+    difficulty_dir = difficulty.lower() if difficulty else '*'
+    pattern = os.path.join(solutions_dir, category_dir, difficulty_dir, '*_solution.py')
+    return sorted(glob.glob(pattern))
+
+
+def find_question_id(storage, solution_path, scan_catalog=True):
+    """
+    Find the ID of the question a solution file belongs to
+    With scan_catalog off only the index is used, which needs no catalog read
+    """
+    index = get_solution_index()
+    question_id = index.lookup(solution_path)
+    if question_id is not None or not scan_catalog:
+        return question_id
+    
+    # Not indexed yet (e.g. created by hand): find the question scaffolded at exactly this path
+    target = os.path.abspath(solution_path)
+    for question in storage.read_questions().to_dict('records'):
+        if os.path.abspath(solution_path_for(question, SOLUTIONS_DIR)) == target:
+            index.add(solution_path, question['id'])
+            return question['id']
+    
+    print(f"No question matches {solution_path}")
+    return None
+
+
+def rebuild_solution_index(storage):
+    """Rebuild the solution index from the solution files on disk"""
+    entries = []
+    for question in storage.read_questions().to_dict('records'):
+        solution_path = solution_path_for(question, SOLUTIONS_DIR)
+        if os.path.exists(solution_path):
+            entries.append((solution_path, question['id']))
+    
+    index = get_solution_index()
+    index.rebuild(entries)
+    print(f"Indexed {len(index)} solution files in {INDEX_PATH}")
+    
+    indexed = {os.path.abspath(path) for path, _ in entries}
+    for solution_path in find_solution_files(SOLUTIONS_DIR):
+        if os.path.abspath(solution_path) not in indexed:
+            print(f"  No question matches {os.path.relpath(solution_path, project_root)}")
+
+
+def run_all_tests(solution_paths, max_workers=None, time_limit=None, memory_limit_mb=None, force=False):
+    """
+    Run the tests of many solution files across a pool of worker processes
+    Files unchanged since their last run report their cached verdicts unless force is set
+    Returns a list of (solution_path, passed, from_cache) tuples in the order given
+    """
+    from functools import partial
+    from concurrent.futures import ProcessPoolExecutor
+    from src.utils.solution_tester import run_solution_file
+    
+    max_workers = max_workers or os.cpu_count() or 1
+    worker = partial(run_solution_file, time_limit=time_limit, memory_limit_mb=memory_limit_mb,
+                     verdict_cache_dir=VERDICT_CACHE_DIR, force=force)
+    results = []
+    
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(solution_paths))) as executor:
+        for solution_path, passed, from_cache, output in executor.map(worker, solution_paths):
+            print(f"{'PASS' if passed else 'FAIL'}  {os.path.relpath(solution_path, project_root)}"
+                  f"{'  (cached)' if from_cache else ''}")
+            if not passed:
+                print(output)
+            results.append((solution_path, passed, from_cache))
+    
+    return results
+
+
+def new_question(storage, category=None, difficulty=None, graphql_url=None, cache=None):
+    """Pick the next question to solve or review and scaffold its solution file"""
+    question = get_scheduler(storage).next_question(category, difficulty)
+    if question is None:
+        print("No matching uncompleted questions found.")
+        return None
+    
+    print(f"\n{'Review' if question['review'] else 'Next question'}: {question['title']}")
+    print(f"Difficulty: {question['difficulty']}")
+    print(f"Category: {question['category']}")
+    print(f"URL: {question['url']}")
+    
+    # Create solution file
+    solution_path = create_solution_file(question, TEMPLATE_PATH, SOLUTIONS_DIR, graphql_url, cache)
+    print(f"\nPlease open {solution_path} to start coding your solution.")
+    return solution_path
+
+
+def test_solution(storage, solution_path, time_limit=None, memory_limit_mb=None, profile_memory=False,
+                  force=False):
+    """Test a solution file and mark its question completed if all tests pass"""
+    from src.utils.solution_tester import SolutionTester
+    from src.utils.verdict_cache import VerdictCache
+    
+    if not os.path.exists(solution_path):
+        print(f"Solution file not found: {solution_path}")
+        return False
+    
+    tester = SolutionTester(solution_path, time_limit, memory_limit_mb, profile_memory=profile_memory)
+    tests_passed = tester.run_tests(VerdictCache(VERDICT_CACHE_DIR), force)
+    
+    if tests_passed:
+        print("All tests passed!")
+    if tester.from_cache:
+        # The verdicts were already recorded when they were computed
+        return tests_passed
+    
+    # Extract question ID from file path to update status and schedule the next review.
+    # A failure doesn't change the tracked status, so it only needs the index and the
+    # saved schedule, not the catalog read behind a full lookup and sync
+    question_id = find_question_id(storage, solution_path, scan_catalog=tests_passed)
+    if question_id is not None:
+        if tests_passed:
+            storage.update_question_status(question_id, completed=True)
+        if hasattr(storage, 'record_attempt'):
+            storage.record_attempt(question_id, tests_passed)
+            attempts = storage.get_attempts(question_id)
+            print(f"Attempt {len(attempts)} at this question, "
+                  f"{sum(1 for attempt in attempts if attempt['passed'])} passed")
+        scheduler = get_scheduler(storage, sync=tests_passed)
+        if question_id in scheduler:
+            next_review = scheduler.record_outcome(question_id, tests_passed)
+            if next_review:
+                print(f"Next review on {next_review}")
+    
+    return tests_passed
+
+
+def show_catalog_diff(refs):
+    """
+    Show how the scraped catalog changed
+    
+    With no refs, list every recorded change. With one snapshot hash (or prefix),
+    compare it with the latest snapshot, with two compare them with each other.
+    """
+    from src.utils.catalog_snapshots import CatalogSnapshotStore, print_delta
+    
+    snapshots = CatalogSnapshotStore(CATALOG_DIR)
+    if not refs:
+        history = snapshots.history()
+        if not history:
+            print("No catalog snapshots yet. Run --fetch first.")
+            return None
+        for delta in history:
+            print(f"{delta['date']}  {(delta['from'] or 'empty')[:12]} -> {delta['to'][:12]}  ({delta['size']} questions)")
+            print_delta(delta)
+        return len(history)
+    
+    if len(refs) > 2:
+        print("--catalog-diff takes at most two snapshot hashes")
+        return None
+    try:
+        old_hash = snapshots.resolve(refs[0])
+        new_hash = snapshots.resolve(refs[1]) if len(refs) == 2 else snapshots.head()
+        delta = snapshots.diff(snapshots.load(old_hash), snapshots.load(new_hash))
+    except (OSError, ValueError, TypeError) as e:
+        print(f"Cannot compare catalog snapshots: {e}")
+        return None
+    print(f"{old_hash[:12]} -> {new_hash[:12]}: ", end='')
+    print_delta(delta)
+    return delta
+
+
+def show_status(storage):
+    """Print how many questions are completed, overall and per difficulty"""
+    questions_df = storage.read_questions()
+    if questions_df.empty:
+        print("No questions tracked yet. Run --fetch first.")
+        return None
+    
+    completed = questions_df['completed'] == True
+    print(f"Completed {int(completed.sum())} of {len(questions_df)} questions")
+    for difficulty, group in questions_df.groupby('difficulty'):
+        print(f"  {difficulty}: {int((group['completed'] == True).sum())}/{len(group)}")
+    return int(completed.sum())
+
+
+def handle_daemon_request(request, default_storage):
+    """Run a command on behalf of the CLI inside the test daemon, against the storage the CLI asked for"""
+    storage = get_storage(request.get('storage', default_storage))
+    command = request.get('command')
+    if command == 'test':
+        return test_solution(storage, request['path'], request.get('time_limit'),
+                             request.get('memory_limit_mb'), request.get('profile_memory', False),
+                             request.get('force', False))
+    elif command == 'new':
+        return new_question(storage, request.get('category'), request.get('difficulty'),
+                            request.get('graphql_url'), get_http_cache(request.get('cache_mode')))
+    elif command == 'status':
+        return show_status(storage)
+    
+    print(f"Unknown daemon command: {command}")
+    return None
+
+
+def cache_mode(args):
+    """Return the HTTP cache mode selected on the command line"""
+    if args.cache_only:
+        return 'cache-only'
+    if args.refresh:
+        return 'refresh'
+    return 'normal'
+
+
+def forward_to_daemon(args, time_limit, memory_limit_mb):
+    """
+    Send the test, new-question and status commands to a running daemon
+    Returns the set of commands the daemon handled (empty if none is running)
+    """
+    from src.utils.test_daemon import request_daemon
+    
+    requests_to_send = []
+    if args.new:
+        requests_to_send.append({'command': 'new', 'category': args.category, 'difficulty': args.difficulty,
+                                 'graphql_url': args.graphql_url, 'cache_mode': cache_mode(args)})
+    if args.test:
+        requests_to_send.append({'command': 'test', 'path': os.path.abspath(args.test),
+                                 'time_limit': time_limit, 'memory_limit_mb': memory_limit_mb,
+                                 'profile_memory': args.memory, 'force': args.force})
+    if args.status:
+        requests_to_send.append({'command': 'status'})
+    
+    handled = set()
+    for request in requests_to_send:
+        request['storage'] = args.storage
+        response = request_daemon(DAEMON_SOCKET, request)
+        if response is None:
+            break
+        print(response['output'], end='')
+        handled.add(request['command'])
+    return handled
+
+
+def profile_startup(argv, top=15):
+    """
+    Re-run the CLI with `-X importtime` and report cumulative import costs
+    per top-level package, plus the total wall-clock time of the command
+    """
+    import subprocess
+    import time
+    
+    command = [sys.executable, '-X', 'importtime', script_path, '--no-daemon']
+    command += [arg for arg in argv if arg != '--startup-profile']
+    start = time.perf_counter()
+    result = subprocess.run(command, stderr=subprocess.PIPE, text=True)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    
+    # Lines look like "import time:  self [us] | cumulative | imported package",
+    # with nested imports indented under the package that imported them
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'imported package' in line:
+            continue
+        _, cumulative_us, package = line[len('import time:'):].split('|')
+        if package.startswith('  '):
+            continue
+        name = package.strip().split('.')[0]
+        cumulative[name] = cumulative.get(name, 0) + int(cumulative_us)
+    
+    total_ms = sum(cumulative.values()) / 1000
+    print(f"\nStartup profile: {elapsed_ms:.0f} ms wall clock, {total_ms:.0f} ms in imports")
+    print(f"{'cumulative (ms)':>16}  package")
+    for name, cumulative_us in sorted(cumulative.items(), key=lambda item: -item[1])[:top]:
+        print(f"{cumulative_us / 1000:>16.1f}  {name}")
+
+
+def get_storage(kind):
+    """Return the tracking store for the given backend ('csv' or 'sqlite'), creating it on first use"""
+    if kind not in _storages:
+        if kind == 'sqlite':
+            from src.scrapers.sqlite_handler import SQLiteHandler
+            _storages[kind] = SQLiteHandler(DB_PATH)
+        else:
+            from src.scrapers.csv_handler import CSVHandler
+            _storages[kind] = CSVHandler(CSV_PATH)
+    return _storages[kind]
+
+
 def main():
     parser = argparse.ArgumentParser(description='NeetCode 150 DSA Tracker')
     parser.add_argument('--fetch', action='store_true', help='Fetch questions from NeetCode')
@@ -147,80 +542,225 @@ def main():
     parser.add_argument('--difficulty', type=str, choices=['Easy', 'Medium', 'Hard'], 
                         help='Filter by difficulty')
     parser.add_argument('--test', type=str, help='Test a specific solution file')
-    parser.add_argument('--commit', action='store_true', help='Commit and push changes to git')
+    parser.add_argument('--test-all', action='store_true',
+                        help='Test all solution files in parallel (honours --category and --difficulty)')
+    parser.add_argument('--force', action='store_true',
+                        help='Rerun tests of solution files whose verdicts are cached (with --test or --test-all)')
+    parser.add_argument('--memory', action='store_true',
+                        help='Profile peak memory and allocation sites of each test case (with --test)')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Number of worker processes for --test-all (default: number of CPUs) '
+                             'or connections for --prefetch (default: 8)')
+    parser.add_argument('--timeout', type=float, default=10.0,
+                        help='Wall-clock time limit per test case in seconds (default: 10, 0 to disable)')
+    parser.add_argument('--memory-limit', type=int, default=512,
+                        help='Memory limit per test case in MB (default: 512, 0 to disable)')
+    parser.add_argument('--bench', type=str, help='Benchmark a specific solution file')
+    parser.add_argument('--warmup', type=int, default=5, help='Untimed warmup runs per test case for --bench')
+    parser.add_argument('--repeat', type=int, default=50, help='Timed runs per test case for --bench')
+    parser.add_argument('--no-gc', action='store_true', help='Disable garbage collection while benchmarking')
+    parser.add_argument('--cpu', type=int, default=None, help='Pin the process to this CPU while benchmarking')
+    parser.add_argument('--keep-outliers', action='store_true',
+                        help='Keep slow outlier runs in the --bench statistics')
+    parser.add_argument('--complexity', type=str,
+                        help='Estimate the time complexity of a solution file and check its docstring')
+    parser.add_argument('--sizes', type=str, default=None,
+                        help='Comma-separated input sizes for --complexity (e.g. 16,32,64,128)')
+    parser.add_argument('--status', action='store_true', help='Show how many questions are completed')
+    parser.add_argument('--storage', choices=['csv', 'sqlite'], default=os.environ.get('DSA_STORAGE', 'csv'),
+                        help='Tracking store to use (default: $DSA_STORAGE or csv)')
+    parser.add_argument('--import-csv', action='store_true',
+                        help='Replace the SQLite store contents with questions.csv')
+    parser.add_argument('--export-csv', action='store_true',
+                        help='Write the SQLite store contents to questions.csv')
+    parser.add_argument('--prefetch', action='store_true',
+                        help='Fetch and store the descriptions of every question concurrently')
+    parser.add_argument('--generate-tests', action='store_true',
+                        help='Generate test cases from the examples of every stored description')
+    cache_group = parser.add_mutually_exclusive_group()
+    cache_group.add_argument('--cache-only', action='store_true',
+                             help='Only use cached LeetCode and NeetCode responses, never the network')
+    cache_group.add_argument('--refresh', action='store_true',
+                             help='Ignore cached responses and stored descriptions and fetch them again')
+    parser.add_argument('--rate', type=float, default=5.0,
+                        help='Maximum LeetCode requests per second for --prefetch (default: 5, 0 to disable)')
+    parser.add_argument('--graphql-url', type=str, default=None,
+                        help='LeetCode GraphQL endpoint (default: $LEETCODE_GRAPHQL_URL or leetcode.com)')
+    parser.add_argument('--catalog-diff', nargs='*', metavar='HASH',
+                        help='Show the catalog change history, or compare one snapshot with the latest or two with each other')
+    parser.add_argument('--rebuild-index', action='store_true',
+                        help='Rebuild the solution file -> question index from the files on disk')
+    parser.add_argument('--commit', action='store_true', help='Commit changes to git and queue a push')
+    parser.add_argument('--push-status', action='store_true', help='Show pushes queued by --commit')
+    parser.add_argument('--daemon', action='store_true',
+                        help='Run a warm test daemon that answers --test, --new and --status requests')
+    parser.add_argument('--stop-daemon', action='store_true', help='Stop a running test daemon')
+    parser.add_argument('--no-daemon', action='store_true',
+                        help='Run in this process even if a test daemon is running')
+    parser.add_argument('--startup-profile', action='store_true',
+                        help='Run the given command under -X importtime and report the slowest imports')
     
     args = parser.parse_args()
+    time_limit = args.timeout or None
+    memory_limit_mb = args.memory_limit or None
+    
+    if args.startup_profile:
+        profile_startup(sys.argv[1:])
+        return
+    
+    if args.catalog_diff is not None:
+        show_catalog_diff(args.catalog_diff)
+        return
+    
+    # Reads only the queue file, so it doesn't load storage or git
+    if args.push_status:
+        from src.scrapers.push_queue import PushQueue, print_push_status
+        print_push_status(PushQueue(PUSH_QUEUE_PATH, project_root).status())
+        return
     
-    csv_handler = CSVHandler(CSV_PATH)
-    git_handler = GitHandler(project_root)
+    if args.stop_daemon:
+        from src.utils.test_daemon import request_daemon
+        response = request_daemon(DAEMON_SOCKET, {'command': 'shutdown'})
+        if response:
+            print(response['output'], end='')
+        else:
+            print("No test daemon is running.")
+        return
+    
+    # Hand test, new-question and status requests to a warm daemon when one is running.
+    # Other commands run here, and some of them (--fetch, --rebuild-index, ...) must run
+    # before --new or --test, so everything runs in this process when any are given
+    requested = {name for name in ('new', 'test', 'status') if getattr(args, name)}
+    other_commands = (args.fetch or args.prefetch or args.generate_tests or args.rebuild_index or
+                      args.import_csv or args.export_csv or args.test_all or args.bench or
+                      args.complexity or args.commit or args.daemon)
+    handled = set()
+    if requested and not other_commands and not args.no_daemon:
+        handled = forward_to_daemon(args, time_limit, memory_limit_mb)
+    if requested and handled == requested:
+        return
     
-    # Ensure git is initialized
-    git_handler.ensure_git_initialized()
+    storage = get_storage(args.storage)
+    
+    # Move tracking data between questions.csv and the SQLite store
+    if args.import_csv:
+        get_storage('sqlite').import_csv(CSV_PATH)
+    if args.export_csv:
+        get_storage('sqlite').export_csv(CSV_PATH)
     
     # Fetch questions from NeetCode
     if args.fetch:
-        questions_df = fetch_neetcode_questions()
+        from src.scrapers.neetcode_scraper import fetch_neetcode_questions
+        from src.utils.catalog_snapshots import CatalogSnapshotStore
+        questions_df = fetch_neetcode_questions(get_http_cache(cache_mode(args)), CatalogSnapshotStore(CATALOG_DIR))
         if not questions_df.empty:
-            # Merge with existing data to preserve completion status
-            existing_df = csv_handler.read_questions()
-            if not existing_df.empty:
-                # Keep track of completed questions
-                completed_dict = {row['id']: (row['completed'], row['date_completed']) 
-                                 for _, row in existing_df.iterrows() if row['completed']}
-                
-                # Update completion status in new dataframe
-                for idx, row in questions_df.iterrows():
-                    if row['id'] in completed_dict:
-                        questions_df.at[idx, 'completed'] = completed_dict[row['id']][0]
-                        questions_df.at[idx, 'date_completed'] = completed_dict[row['id']][1]
-            
-            csv_handler.save_questions(questions_df)
+            # Merge with existing data to preserve completion status and user columns
+            from src.utils.catalog_merge import merge_question_catalogs, print_catalog_changes
+            questions_df, changes = merge_question_catalogs(questions_df, storage.read_questions())
+            print_catalog_changes(changes)
+            storage.save_questions(questions_df)
+            get_scheduler(storage, sync=False).sync(questions_df, storage.file_signature())
+    
+    # Store the descriptions of the whole catalog
+    if args.prefetch:
+        prefetch_descriptions(storage, args.graphql_url, args.workers or 8, args.rate,
+                              get_http_cache(cache_mode(args)))
+    
+    # Generate test cases from the stored descriptions
+    if args.generate_tests:
+        generate_all_test_cases(GENERATED_TESTS_PATH)
+    
+    # Rebuild the solution index
+    if args.rebuild_index:
+        rebuild_solution_index(storage)
     
     # Get a new question
-    if args.new:
-        question = csv_handler.get_next_question(args.category, args.difficulty)
-        if question is not None:
-            print(f"\nNext question: {question['title']}")
-            print(f"Difficulty: {question['difficulty']}")
-            print(f"Category: {question['category']}")
-            print(f"URL: {question['url']}")
-            
-            # Create solution file
-            solution_path = create_solution_file(question, TEMPLATE_PATH, SOLUTIONS_DIR)
-            print(f"\nPlease open {solution_path} to start coding your solution.")
-        else:
-            print("No matching uncompleted questions found.")
+    if args.new and 'new' not in handled:
+        new_question(storage, args.category, args.difficulty, args.graphql_url,
+                     get_http_cache(cache_mode(args)))
     
     # Test a solution
-    if args.test:
-        solution_path = args.test
-        if not os.path.exists(solution_path):
-            print(f"Solution file not found: {solution_path}")
+    if args.test and 'test' not in handled:
+        if not os.path.exists(args.test):
+            print(f"Solution file not found: {args.test}")
+            return
+        test_solution(storage, args.test, time_limit, memory_limit_mb, args.memory, args.force)
+    
+    # Show progress
+    if args.status and 'status' not in handled:
+        show_status(storage)
+    
+    # Test all solutions
+    if args.test_all:
+        solution_paths = find_solution_files(SOLUTIONS_DIR, args.category, args.difficulty)
+        if not solution_paths:
+            print("No matching solution files found.")
             return
         
-        tester = SolutionTester(solution_path)
-        tests_passed = tester.run_tests()
+        results = run_all_tests(solution_paths, args.workers, time_limit, memory_limit_mb, args.force)
+        passed_paths = [path for path, passed, _ in results if passed]
+        print(f"\nSummary: {len(passed_paths)} passed, {len(results) - len(passed_paths)} failed "
+              f"out of {len(results)} solution files")
         
-        if tests_passed:
-            print("All tests passed!")
-            
-            # Extract question ID from file path to update status
-            filename = os.path.basename(solution_path)
-            questions_df = csv_handler.read_questions()
-            
-            # Try to find matching question based on filename
-            for idx, row in questions_df.iterrows():
-                sanitized_title = sanitize_filename(row['title'])
-                if sanitized_title in filename:
-                    csv_handler.update_question_status(row['id'], completed=True)
-                    break
+        # Mark every question that passed a fresh run completed with a single write,
+        # cached verdicts were already recorded when they were computed
+        outcomes = [(find_question_id(storage, path), passed) for path, passed, from_cache in results
+                    if not from_cache]
+        outcomes = [(question_id, passed) for question_id, passed in outcomes if question_id is not None]
+        question_ids = [question_id for question_id, passed in outcomes if passed]
+        if question_ids:
+            storage.update_question_statuses(question_ids, completed=True)
+        if outcomes and hasattr(storage, 'record_attempts'):
+            storage.record_attempts(outcomes)
+        if outcomes:
+            get_scheduler(storage).record_outcomes(outcomes)
+    
+    # Benchmark a solution
+    if args.bench:
+        if not os.path.exists(args.bench):
+            print(f"Solution file not found: {args.bench}")
+            return
+        
+        from src.utils.solution_benchmark import SolutionBenchmark
+        benchmark = SolutionBenchmark(args.bench, warmup=args.warmup, repeat=args.repeat,
+                                      disable_gc=args.no_gc, cpu=args.cpu,
+                                      reject_outliers=not args.keep_outliers)
+        results = benchmark.run()
+        if results is not None:
+            benchmark.print_report(results)
+            benchmark.save_results(results)
+    
+    # Estimate the time complexity of a solution
+    if args.complexity:
+        if not os.path.exists(args.complexity):
+            print(f"Solution file not found: {args.complexity}")
+            return
+        
+        sizes = [int(size) for size in args.sizes.split(',')] if args.sizes else None
+        from src.utils.complexity_estimator import ComplexityEstimator
+        estimator = ComplexityEstimator(args.complexity, sizes=sizes)
+        result = estimator.estimate()
+        if result is not None:
+            estimator.print_report(result)
+    
+    # Serve requests from the CLI until stopped
+    if args.daemon:
+        from src.utils.test_daemon import TestDaemon
+        TestDaemon(DAEMON_SOCKET, lambda request: handle_daemon_request(request, args.storage)).serve()
     
     # Commit and push changes
     if args.commit:
+        from src.scrapers.git_handler import GitHandler
+        from src.scrapers.push_queue import PushQueue
+        git_handler = GitHandler(project_root)
+        
         print("Committing and pushing changes to git...")
         message = f"Add solution for {datetime.now().strftime('%Y-%m-%d')}"
-        result = git_handler.add_commit_push(message=message)
-        if result:
+        result = git_handler.add_commit_push(message=message, patterns=COMMIT_PATTERNS,
+                                             push_queue=PushQueue(PUSH_QUEUE_PATH, project_root))
+        if result and "queued" in result:
+            print(f"Changes committed. {result}, check progress with --push-status.")
+        elif result:
             print("Changes successfully committed and pushed.")
         else:
             print("Failed to commit and push changes.")
@@ -0,0 +1,239 @@
+import re
+import json
+import codecs
+
+# Every problem record in the NeetCode bundle is an object literal starting with
+# RECORD_START and containing RECORD_ANCHOR, which few other objects have
+RECORD_START = '{id:"'
+RECORD_ANCHOR = 'neetCode:'
+
+# Records longer than this are not problem records, skip them instead of buffering more
+MAX_RECORD_CHARS = 16384
+
+REQUIRED_FIELDS = ('id', 'title', 'difficulty', 'category', 'link')
+
+_INCOMPLETE = object()
+
+# One complete `key:value,` or `key:value}` field with a string or bare literal value.
+# Matched at a fixed position, so it never scans ahead through the bundle.
+_STRING = r'"[^"\\]*(?:\\.[^"\\]*)*"'
+_FIELD = re.compile(rf'([A-Za-z_$][\w$]*|{_STRING}):({_STRING}|[^,{{}}\[\]"():]*)([,}}])')
+
+
+class _Invalid(Exception):
+    """The text at a record start is not an object literal"""
+
+
+def _parse_string(text, i):
+    """Parse a double-quoted string starting at text[i], returning (value, end)"""
+    j = i + 1
+    while True:
+        j = text.find('"', j)
+        if j == -1:
+            return _INCOMPLETE, len(text)
+        # The quote is escaped if it follows an odd number of backslashes
+        backslashes = 0
+        while text[j - 1 - backslashes] == '\\':
+            backslashes += 1
+        if backslashes % 2 == 0:
+            break
+        j += 1
+
+    return _unescape(text[i + 1:j]), j + 1
+
+
+def _unescape(raw):
+    if '\\' in raw:
+        try:
+            return json.loads(f'"{raw}"')
+        except ValueError:
+            pass
+    return raw
+
+
+def _parse_record(text, start):
+    """
+    Parse an object literal such as {id:"...",order:3,premium:!1} starting at text[start]
+
+    Nested object and array values are skipped and recorded as None.
+
+    Returns:
+        tuple: (record, end), or (_INCOMPLETE, start) if the text ends inside the record
+
+    Raises:
+        _Invalid: If the text is not an object literal of the expected shape
+    """
+    record = {}
+    i = start + 1
+    n = len(text)
+    while True:
+        # Fast path: a whole field with a simple value in one match
+        field = _FIELD.match(text, i)
+        if field:
+            key, value, terminator = field.groups()
+            if key[0] == '"':
+                key = _unescape(key[1:-1])
+            record[key] = _unescape(value[1:-1]) if value[:1] == '"' else _literal(value.strip())
+            if terminator == '}':
+                return record, field.end()
+            i = field.end()
+            continue
+
+        # Key: an identifier or a quoted string
+        if i >= n:
+            return _INCOMPLETE, start
+        if text[i] == '"':
+            key, i = _parse_string(text, i)
+            if key is _INCOMPLETE:
+                return _INCOMPLETE, start
+        else:
+            j = i
+            while j < n and (text[j].isalnum() or text[j] in '_$'):
+                j += 1
+            if j == n:
+                return _INCOMPLETE, start
+            if j == i:
+                raise _Invalid()
+            key, i = text[i:j], j
+
+        if i >= n:
+            return _INCOMPLETE, start
+        if text[i] != ':':
+            raise _Invalid()
+        i += 1
+        if i >= n:
+            return _INCOMPLETE, start
+
+        # Value: a string, or a bare literal such as 3, true or !0
+        if text[i] == '"':
+            value, i = _parse_string(text, i)
+            if value is _INCOMPLETE:
+                return _INCOMPLETE, start
+        elif text[i] in '{[':
+            # Nested values (e.g. a list of companies) are skipped, only flat fields are kept
+            end = _skip_nested(text, i)
+            if end is _INCOMPLETE:
+                return _INCOMPLETE, start
+            value, i = None, end
+        else:
+            j = i
+            while j < n and text[j] not in ',}':
+                if text[j] in '{[(":':
+                    raise _Invalid()
+                j += 1
+            if j == n:
+                return _INCOMPLETE, start
+            value, i = _literal(text[i:j].strip()), j
+
+        record[key] = value
+        if i >= n:
+            return _INCOMPLETE, start
+        if text[i] == '}':
+            return record, i + 1
+        if text[i] != ',':
+            raise _Invalid()
+        i += 1
+
+
+def _skip_nested(text, i):
+    """Return the index after the balanced object or array literal starting at text[i]"""
+    depth = 0
+    n = len(text)
+    while i < n:
+        char = text[i]
+        if char == '"':
+            _, i = _parse_string(text, i)
+            if i >= n:
+                return _INCOMPLETE
+            continue
+        if char in '{[':
+            depth += 1
+        elif char in '}]':
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return _INCOMPLETE
+
+
+def _literal(token):
+    """Convert a bare JavaScript literal, including minified booleans like !0 and !1"""
+    if token in ('true', '!0'):
+        return True
+    if token in ('false', '!1'):
+        return False
+    try:
+        return int(token)
+    except ValueError:
+        return token
+
+
+def _record_around(text, anchor, low):
+    """
+    Find the record containing text[anchor] by trying record starts backwards from it
+
+    Returns:
+        tuple: (record, start, end), (_INCOMPLETE, start, None) if the text ends
+               inside the record, or (None, None, None) if no record contains the anchor
+    """
+    start = anchor
+    while True:
+        start = text.rfind(RECORD_START, low, start)
+        if start == -1:
+            return None, None, None
+        try:
+            record, end = _parse_record(text, start)
+        except _Invalid:
+            continue
+        if record is _INCOMPLETE:
+            return _INCOMPLETE, start, None
+        if end > anchor:
+            return record, start, end
+        # A record that closes before the anchor, e.g. one nested inside the record we want
+
+
+def iter_problem_records(chunks):
+    """
+    Yield the NeetCode 150 problem records of a JavaScript bundle as they are found
+
+    The bundle is read chunk by chunk. Each `neetCode:` key anchors a search
+    back to the start of its record, which is then tokenized forwards, so the
+    many other `{id:"...` objects in the bundle are never parsed. Only the
+    text after the last complete record is kept between chunks, so memory
+    stays bounded by the chunk size and MAX_RECORD_CHARS rather than the size
+    of the bundle.
+
+    Args:
+        chunks (iterable): The bundle as bytes or str chunks, e.g. response.iter_content()
+
+    Yields:
+        dict: The fields of each record marked neetCode:true
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    buffer = ''
+    for chunk in chunks:
+        buffer += decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+        pos = 0
+        while True:
+            anchor = buffer.find(RECORD_ANCHOR, pos)
+            if anchor == -1:
+                # Keep any record start whose anchor may be in the next chunk. The
+                # first one is kept, since later ones may be nested inside it.
+                start = buffer.find(RECORD_START, max(pos, len(buffer) - MAX_RECORD_CHARS))
+                pos = start if start != -1 else max(pos, len(buffer) - len(RECORD_ANCHOR) + 1)
+                break
+
+            record, start, end = _record_around(buffer, anchor, max(pos, anchor - MAX_RECORD_CHARS))
+            if record is _INCOMPLETE:
+                if len(buffer) - start <= MAX_RECORD_CHARS:
+                    pos = start
+                    break
+                record = None
+            if record is None:
+                pos = anchor + 1
+                continue
+
+            if record.get('neetCode') is True and all(field in record for field in REQUIRED_FIELDS):
+                yield record
+            pos = end
+        buffer = buffer[pos:]
@@ -1,18 +1,25 @@
-import pandas as pd
 import os
 from datetime import datetime
 
+from src.utils.file_modes import locked, write_atomic
+
 class CSVHandler:
     def __init__(self, csv_path):
         self.csv_path = csv_path
+        # Parsed copy of the CSV and the (mtime, size, inode) it was read at
+        self._cached_df = None
+        self._cached_signature = None
         self.ensure_csv_exists()
     
     def ensure_csv_exists(self):
         """Creates the CSV file if it doesn't exist"""
-        if not os.path.exists(os.path.dirname(self.csv_path)):
-            os.makedirs(os.path.dirname(self.csv_path))
+        csv_dir = os.path.dirname(self.csv_path)
+        if csv_dir and not os.path.exists(csv_dir):
+            os.makedirs(csv_dir)
             
         if not os.path.exists(self.csv_path):
+            import pandas as pd
+            
             # Create an empty DataFrame with the required columns
             empty_df = pd.DataFrame(columns=[
                 'id', 'title', 'url', 'difficulty', 
@@ -21,18 +28,63 @@ class CSVHandler:
             empty_df.to_csv(self.csv_path, index=False)
             print(f"Created new tracking file at {self.csv_path}")
     
+    def file_signature(self):
+        """Return (mtime, size, inode) of the CSV file, or None if it can't be stat'ed"""
+        try:
+            stat = os.stat(self.csv_path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    
+    def _update_cache(self, questions_df, signature):
+        """Remember a parsed copy of the file as it was when it had the given signature"""
+        self._cached_signature = signature
+        self._cached_df = questions_df.copy() if signature is not None else None
+    
     def read_questions(self):
-        """Reads the questions from the CSV file"""
+        """
+        Reads the questions from the CSV file
+        The parsed file is cached until its mtime, size or inode change
+        """
+        # pandas is imported on first use to keep CLI startup fast
+        import pandas as pd
+        
+        # Stat before reading, so a file replaced during the read is never cached under its new signature
+        signature = self.file_signature()
+        if self._cached_df is not None and signature == self._cached_signature:
+            return self._cached_df.copy()
+        
         try:
-            return pd.read_csv(self.csv_path)
+            # Keep empty cells as '' like SQLiteHandler.import_csv, so a column with no
+            # values yet (e.g. date_completed) isn't read as float64 and can take strings
+            questions_df = pd.read_csv(self.csv_path, keep_default_na=False)
+            self._update_cache(questions_df, signature)
+            return questions_df
         except Exception as e:
             print(f"Error reading CSV: {e}")
             return pd.DataFrame()
     
+    def _write_atomic(self, questions_df):
+        """Write the CSV atomically and durably, so readers never see a partial file"""
+        write_atomic(self.csv_path, questions_df.to_csv(index=False), fsync=True)
+        self._update_cache(questions_df, self.file_signature())
+    
+    def _unchanged(self, questions_df):
+        """Whether the CSV already holds exactly what questions_df would be written as"""
+        try:
+            with open(self.csv_path, 'r', newline='') as f:
+                return f.read() == questions_df.to_csv(index=False)
+        except OSError:
+            return False
+    
     def save_questions(self, questions_df):
-        """Saves the questions DataFrame to the CSV file"""
+        """Saves the questions DataFrame to the CSV file, skipping the write if nothing changed"""
         try:
-            questions_df.to_csv(self.csv_path, index=False)
+            with locked(self.csv_path):
+                if self._unchanged(questions_df):
+                    print(f"No changes to save to {self.csv_path}")
+                    return True
+                self._write_atomic(questions_df)
             print(f"Successfully saved {len(questions_df)} questions to {self.csv_path}")
             return True
         except Exception as e:
@@ -41,34 +93,34 @@ class CSVHandler:
     
     def update_question_status(self, question_id, completed=True):
         """Marks a question as completed"""
-        df = self.read_questions()
-        if question_id in df['id'].values:
-            idx = df.index[df['id'] == question_id].tolist()[0]
-            df.at[idx, 'completed'] = completed
-            df.at[idx, 'date_completed'] = datetime.now().strftime('%Y-%m-%d') if completed else ''
-            return self.save_questions(df)
-        else:
-            print(f"Question ID {question_id} not found")
-            return False
+        return self.update_question_statuses([question_id], completed)
     
-    def get_next_question(self, category=None, difficulty=None):
+    def update_question_statuses(self, question_ids, completed=True):
         """
-        Gets the next uncompleted question, optionally filtered by category and difficulty
-        Returns a pandas Series with the question details or None if no questions match
+        Marks several questions as completed with a single locked write
+        The file is re-read under the lock so concurrent updates are not lost
+        Questions already in the requested state keep their completion date, and
+        the file isn't rewritten if none of them changes
         """
-        df = self.read_questions()
-        
-        # Filter for uncompleted questions
-        uncompleted = df[df['completed'] == False]
-        
-        # Apply additional filters if provided
-        if category:
-            uncompleted = uncompleted[uncompleted['category'] == category]
-        if difficulty:
-            uncompleted = uncompleted[uncompleted['difficulty'] == difficulty]
-        
-        if uncompleted.empty:
-            return None
-        
-        # Return the first uncompleted question
-        return uncompleted.iloc[0]
\ No newline at end of file
+        try:
+            with locked(self.csv_path):
+                df = self.read_questions()
+                mask = df['id'].isin(question_ids)
+                
+                missing = set(question_ids) - set(df.loc[mask, 'id'])
+                for question_id in missing:
+                    print(f"Question ID {question_id} not found")
+                if not mask.any():
+                    return False
+                
+                changed = mask & (df['completed'].astype(str) != str(completed))
+                if not changed.any():
+                    return True
+                df.loc[changed, 'completed'] = completed
+                df.loc[changed, 'date_completed'] = datetime.now().strftime('%Y-%m-%d') if completed else ''
+                self._write_atomic(df)
+            print(f"Successfully saved {len(df)} questions to {self.csv_path}")
+            return True
+        except Exception as e:
+            print(f"Error saving CSV: {e}")
+            return False
\ No newline at end of file
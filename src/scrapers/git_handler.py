@@ -1,12 +1,32 @@
 import os
+import fnmatch
 import subprocess
 from datetime import datetime
-import git  # Import GitPython
+
+# Paths passed to git add per invocation when --pathspec-from-file isn't available
+ADD_BATCH_SIZE = 500
+
+# Repository discovery results per repository path, shared by every GitHandler in the process
+_discovery = {}
 
 class GitHandler:
+    """
+    Git operations on the tracker's repository
+
+    GitPython and the repository are only loaded on the first git operation,
+    so creating a GitHandler costs nothing for commands that never use git.
+    """
+    
     def __init__(self, repo_path):
         self.repo_path = repo_path
-        self.repo = None
+        self._repo = None
+    
+    @property
+    def repo(self):
+        """The git.Repo of the repository, opened (and initialized if needed) on first use"""
+        if self._repo is None:
+            self.ensure_git_initialized()
+        return self._repo
     
     def _run_command(self, command):
         """Run a git command and return the output (fallback method)"""
@@ -26,56 +46,148 @@ class GitHandler:
     
     def ensure_git_initialized(self):
         """Ensures the repository is initialized with git"""
+        import git  # GitPython takes tens of milliseconds to import, so load it only when needed
+        
         # Check if .git directory exists
         git_dir = os.path.join(self.repo_path, ".git")
         if not os.path.exists(git_dir):
             print(f"Initializing git repository in {self.repo_path}")
-            self.repo = git.Repo.init(self.repo_path)
+            self._repo = git.Repo.init(self.repo_path)
+            _discovery.pop(os.path.abspath(self.repo_path), None)
             return "Git repository initialized"
         else:
             try:
-                self.repo = git.Repo(self.repo_path)
+                self._repo = git.Repo(self.repo_path)
                 return "Git repository already initialized"
             except git.InvalidGitRepositoryError:
                 print(f"Invalid git repository at {self.repo_path}. Reinitializing...")
-                self.repo = git.Repo.init(self.repo_path)
+                self._repo = git.Repo.init(self.repo_path)
+                _discovery.pop(os.path.abspath(self.repo_path), None)
                 return "Git repository reinitialized"
     
+    def discover(self):
+        """
+        Returns the git dir, remotes and current branch of the repository
+        
+        The result is cached per process, so repeated calls don't touch the repository again.
+        
+        Returns:
+            dict: 'git_dir', 'remotes' (list of names) and 'branch' (None on a detached HEAD)
+        """
+        key = os.path.abspath(self.repo_path)
+        if key not in _discovery:
+            repo = self.repo
+            try:
+                branch = repo.active_branch.name
+            except TypeError:
+                # Detached HEAD
+                branch = None
+            _discovery[key] = {
+                'git_dir': repo.git_dir,
+                'remotes': [remote.name for remote in repo.remotes],
+                'branch': branch
+            }
+        return _discovery[key]
+    
+    def current_branch(self):
+        """Returns the checked out branch, or None on a detached HEAD"""
+        return self.discover()['branch']
+    
     def remote_exists(self, remote="origin"):
         """Check if the specified remote exists"""
-        if self.repo is None:
-            self.ensure_git_initialized()
-            
         try:
-            return remote in [r.name for r in self.repo.remotes]
+            return remote in self.discover()['remotes']
         except Exception as e:
             print(f"Error checking remote: {e}")
             return False
     
+    def changed_paths(self):
+        """
+        Lists every changed, deleted or untracked path with a single git status pass
+        
+        Returns:
+            list: Paths relative to the repository root, or None if git status failed
+        """
+        if self._repo is None:
+            self.ensure_git_initialized()
+        
+        try:
+            result = subprocess.run(
+                ["git", "status", "--porcelain=v2", "-z", "--untracked-files=all"],
+                cwd=self.repo_path, check=True, capture_output=True
+            )
+        except (OSError, subprocess.CalledProcessError) as e:
+            print(f"Error reading git status: {e}")
+            return None
+        
+        paths = []
+        fields = iter(result.stdout.decode('utf-8', errors='surrogateescape').split('\0'))
+        for record in fields:
+            if not record:
+                continue
+            kind = record[0]
+            if kind == '1':
+                # 1 XY sub mH mI mW hH hI path
+                paths.append(record.split(' ', 8)[8])
+            elif kind == '2':
+                # 2 XY sub mH mI mW hH hI Xscore path, followed by the original path.
+                # The rename is already in the index, so only the new path needs staging.
+                paths.append(record.split(' ', 9)[9])
+                next(fields, None)
+            elif kind == 'u':
+                # u XY sub m1 m2 m3 mW h1 h2 h3 path
+                paths.append(record.split(' ', 10)[10])
+            elif kind == '?':
+                paths.append(record[2:])
+        return paths
+    
+    def scoped_changes(self, patterns):
+        """
+        Returns the changed paths matching any of the given glob patterns
+        
+        Args:
+            patterns (list): fnmatch patterns relative to the repository root, e.g. 'questions/*'
+        """
+        paths = self.changed_paths()
+        if paths is None:
+            return None
+        return [path for path in paths if any(fnmatch.fnmatchcase(path, pattern) for pattern in patterns)]
+    
     def add_files(self, files=None):
         """
         Adds files to git staging
         If files is None, adds all files
         """
-        if self.repo is None:
-            self.ensure_git_initialized()
-            
         try:
             if files is None:
                 self.repo.git.add(A=True)  # Add all files
             else:
-                self.repo.git.add(files)
+                self._add_paths(files)
             return "Files added to staging"
         except Exception as e:
             print(f"Error adding files: {e}")
             # Fall back to subprocess if GitPython fails
             return self._run_command(["git", "add", "."] if files is None else ["git", "add"] + files)
     
+    def _add_paths(self, paths):
+        """Stage exactly the given paths, including deletions, without running into argument limits"""
+        if not paths:
+            return
+        try:
+            subprocess.run(
+                ["git", "add", "--pathspec-from-file=-", "--pathspec-file-nul"],
+                cwd=self.repo_path, check=True, capture_output=True,
+                input='\0'.join(paths).encode('utf-8', errors='surrogateescape')
+            )
+        except subprocess.CalledProcessError:
+            # git older than 2.25 has no --pathspec-from-file
+            for i in range(0, len(paths), ADD_BATCH_SIZE):
+                self.repo.git.add('--', *paths[i:i + ADD_BATCH_SIZE])
+    
     def commit_changes(self, message=None):
         """Commits staged changes with a message"""
-        if self.repo is None:
-            self.ensure_git_initialized()
-            
+        import git
+        
         if message is None:
             # Default commit message
             message = f"Add solution for {datetime.now().strftime('%Y-%m-%d')}"
@@ -92,17 +204,21 @@ class GitHandler:
                 # Fall back to subprocess
                 return self._run_command(["git", "commit", "-m", message])
     
-    def push_changes(self, remote="origin", branch="master"):
-        """Pushes committed changes to the remote repository if it exists"""
-        if self.repo is None:
-            self.ensure_git_initialized()
-            
+    def push_changes(self, remote="origin", branch=None):
+        """Pushes committed changes to the remote repository if it exists (default: the current branch)"""
+        import git
+        
         if not self.remote_exists(remote):
             print(f"Remote '{remote}' doesn't exist. Skipping push.")
             print("To push changes later, set up a remote with:")
             print(f"  git remote add {remote} <repository-url>")
             return "Remote not configured, commit succeeded locally"
         
+        branch = branch or self.current_branch()
+        if branch is None:
+            print("HEAD is detached. Skipping push.")
+            return "Detached HEAD, commit succeeded locally"
+        
         try:
             self.repo.git.push(remote, branch)
             return f"Changes pushed to {remote}/{branch}"
@@ -111,17 +227,44 @@ class GitHandler:
             # Fall back to subprocess
             return self._run_command(["git", "push", remote, branch])
     
-    def add_commit_push(self, files=None, message=None, remote="origin", branch="master"):
-        """Combines add, commit, and push operations"""
+    def queue_push(self, push_queue, remote="origin", branch=None):
+        """Queues a push of the current commit and returns without waiting for the network"""
+        branch = branch or self.current_branch()
+        if branch is None:
+            print("HEAD is detached. Skipping push.")
+            return "Detached HEAD, commit succeeded locally"
+        
+        push_queue.enqueue(remote, branch, self.repo.head.commit.hexsha)
+        push_queue.start_worker()
+        return f"Push to {remote}/{branch} queued"
+    
+    def add_commit_push(self, files=None, message=None, remote="origin", branch=None, patterns=None,
+                        push_queue=None):
+        """
+        Combines add, commit, and push operations
+        With patterns and no files, only the changed paths matching the patterns are staged
+        With a push_queue, the push is queued for a background worker instead of run here
+        """
+        if files is None and patterns is not None:
+            files = self.scoped_changes(patterns)
+            if files is None:
+                return "Error reading git status"
+            if not files:
+                print("No changes to commit")
+                return "No changes to commit"
+            print(f"Staging {len(files)} changed file(s)")
         add_result = self.add_files(files)
-        if "Error" in str(add_result):
+        if add_result is None or "Error" in add_result:
             return add_result
             
+        # The subprocess fallback returns None when the commit failed, so there is nothing to push
         commit_result = self.commit_changes(message)
-        if "No changes to commit" in str(commit_result):
+        if commit_result is None or "No changes to commit" in commit_result:
             return commit_result
             
         if self.remote_exists(remote):
+            if push_queue is not None:
+                return self.queue_push(push_queue, remote, branch)
             return self.push_changes(remote, branch)
         else:
             print(f"Changes committed locally. Remote '{remote}' not configured.")
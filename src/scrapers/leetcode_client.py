@@ -0,0 +1,190 @@
+import os
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from src.utils.file_modes import write_atomic
+
+# Override with $LEETCODE_GRAPHQL_URL or --graphql-url, e.g. to use a local stand-in server
+DEFAULT_GRAPHQL_URL = "https://leetcode.com/graphql"
+
+QUESTION_QUERY = """
+query questionData($titleSlug: String!) {
+    question(titleSlug: $titleSlug) {
+        title
+        content
+        exampleTestcases
+        difficulty
+    }
+}
+"""
+
+# Retries for rate-limited (429) and server error responses
+MAX_RETRIES = 3
+
+
+def problem_slug(url):
+    """Return the LeetCode title slug of a problem URL"""
+    return url.strip('/').split('/')[-1]
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter
+
+    Tokens refill at `rate` per second up to `capacity`, so short bursts are
+    allowed while the long-run request rate stays at `rate`.
+    """
+
+    def __init__(self, rate, capacity=None):
+        """
+        Args:
+            rate (float): Tokens added per second
+            capacity (float): Maximum number of stored tokens (default: rate, at least 1)
+        """
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping until one is available"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class LeetCodeClient:
+    """
+    LeetCode GraphQL client sharing a pool of keep-alive connections between threads
+    """
+
+    def __init__(self, graphql_url=None, max_connections=8, rate=5.0, timeout=10.0, cache=None):
+        """
+        Args:
+            graphql_url (str): GraphQL endpoint (default: $LEETCODE_GRAPHQL_URL or leetcode.com)
+            max_connections (int): Size of the connection pool and of the worker pool
+            rate (float): Maximum requests per second (0 to disable rate limiting)
+            timeout (float): Timeout of each request in seconds
+            cache (HTTPCache): Response cache to consult before the network (None to disable)
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        self.graphql_url = graphql_url or os.environ.get('LEETCODE_GRAPHQL_URL', DEFAULT_GRAPHQL_URL)
+        self.max_connections = max(1, max_connections)
+        self.timeout = timeout
+        self.rate_limiter = TokenBucket(rate) if rate else None
+        self.cache = cache
+
+        self.session = requests.Session()
+        # pool_block makes extra threads wait for a free connection instead of opening new ones
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_connections, pool_block=True)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({'Content-Type': 'application/json', 'Referer': 'https://leetcode.com'})
+
+    def fetch_question(self, slug):
+        """
+        Fetch the details of one problem
+
+        Returns:
+            dict: title, content, exampleTestcases and difficulty of the problem
+
+        Raises:
+            ValueError: If the problem doesn't exist
+            requests.RequestException: If the request keeps failing
+        """
+        payload = {'query': QUESTION_QUERY, 'variables': {'titleSlug': slug}}
+        # Cache hits skip the rate limiter, only network requests count against it
+        cache_key = self.cache.key('POST', self.graphql_url, payload) if self.cache else None
+        response = self.cache.lookup(cache_key, self.graphql_url) if self.cache else None
+        cached = response is not None
+
+        for attempt in range(MAX_RETRIES + 1):
+            if response is not None:
+                break
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+            response = self.session.post(self.graphql_url, timeout=self.timeout, json=payload)
+            if (response.status_code == 429 or response.status_code >= 500) and attempt < MAX_RETRIES:
+                retry_after = response.headers.get('Retry-After', '')
+                time.sleep(float(retry_after) if retry_after.isdigit() else 2 ** attempt)
+                response = None
+                continue
+            response.raise_for_status()
+
+        question = (response.json().get('data') or {}).get('question')
+        if not question:
+            raise ValueError(f"Problem {slug} not found")
+        # Only cache actual problems, an unknown slug or a GraphQL error is worth asking again
+        if self.cache and not cached:
+            self.cache.store(cache_key, 'POST', self.graphql_url, response)
+        return question
+
+    def fetch_questions(self, slugs, on_result=None):
+        """
+        Fetch many problems concurrently
+
+        Args:
+            slugs (list): Title slugs to fetch
+            on_result (callable): Called as on_result(slug, question, error) as each fetch finishes
+
+        Returns:
+            dict: slug -> question details for every problem that was fetched
+        """
+        questions = {}
+        with ThreadPoolExecutor(max_workers=self.max_connections) as executor:
+            futures = {executor.submit(self.fetch_question, slug): slug for slug in slugs}
+            for future in as_completed(futures):
+                slug = futures[future]
+                try:
+                    questions[slug] = future.result()
+                    error = None
+                except Exception as e:
+                    error = e
+                if on_result:
+                    on_result(slug, questions.get(slug), error)
+        return questions
+
+
+class DescriptionStore:
+    """
+    Local store of fetched problem details, one JSON file per problem
+    """
+
+    def __init__(self, store_dir):
+        self.store_dir = store_dir
+
+    def _path(self, slug):
+        return os.path.join(self.store_dir, f"{slug}.json")
+
+    def __contains__(self, slug):
+        return os.path.exists(self._path(slug))
+
+    def slugs(self):
+        """Return the slugs of every stored problem, sorted"""
+        if not os.path.isdir(self.store_dir):
+            return []
+        return sorted(name[:-len('.json')] for name in os.listdir(self.store_dir) if name.endswith('.json'))
+    
+    def get(self, slug):
+        """Return the stored details of a problem, or None if it isn't stored"""
+        try:
+            with open(self._path(slug), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, slug, question):
+        """Store the details of a problem, replacing the file atomically"""
+        write_atomic(self._path(slug), json.dumps(question, indent=2))
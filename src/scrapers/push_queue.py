@@ -0,0 +1,231 @@
+import os
+import sys
+import json
+import time
+import subprocess
+
+from src.utils.file_modes import locked, write_atomic
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
+# Retry delays grow from BASE_DELAY, doubling per failed attempt up to MAX_DELAY
+BASE_DELAY = 5.0
+MAX_DELAY = 15 * 60.0
+# The worker gives up after this many failed attempts in a row, until the next push is queued
+MAX_ATTEMPTS = 8
+PUSH_TIMEOUT = 120
+
+
+class PushQueue:
+    """
+    Durable queue of pushes waiting to reach a remote
+
+    The queue lives in a small JSON file, so queued pushes survive the CLI
+    exiting and are picked up again by the next worker. Pushes to the same
+    remote and branch are coalesced, since one `git push` sends every commit
+    made since the last one. A detached worker process drains the queue,
+    retrying failed pushes with exponential backoff.
+    """
+
+    def __init__(self, queue_path, repo_path):
+        """
+        Args:
+            queue_path (str): JSON file holding the queue state
+            repo_path (str): Repository the pushes are made from
+        """
+        self.queue_path = queue_path
+        self.repo_path = repo_path
+        self.worker_lock_path = queue_path + '.worker'
+
+    def _read(self):
+        try:
+            with open(self.queue_path, 'r') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            state = {}
+        state.setdefault('pending', [])
+        state.setdefault('attempts', 0)
+        state.setdefault('next_attempt_at', 0)
+        state.setdefault('last_error', None)
+        state.setdefault('last_push', None)
+        return state
+
+    def _write(self, state):
+        write_atomic(self.queue_path, json.dumps(state, indent=2))
+
+    def enqueue(self, remote, branch, commit):
+        """
+        Queue a push of a branch, merging it with a queued push of the same branch
+
+        Args:
+            remote (str): Remote to push to
+            branch (str): Branch to push
+            commit (str): Commit the branch points at
+        """
+        with locked(self.queue_path):
+            state = self._read()
+            for item in state['pending']:
+                if item['remote'] == remote and item['branch'] == branch:
+                    item['commit'] = commit
+                    item['commits'] += 1
+                    break
+            else:
+                state['pending'].append({'remote': remote, 'branch': branch, 'commit': commit,
+                                         'commits': 1, 'queued_at': time.time()})
+            # A new push is worth trying right away, even after earlier failures
+            state['attempts'] = 0
+            state['next_attempt_at'] = 0
+            self._write(state)
+
+    def status(self):
+        """Return the queue state, with 'worker_running' telling whether a worker is draining it"""
+        with locked(self.queue_path):
+            state = self._read()
+        state['worker_running'] = self._worker_running()
+        return state
+
+    def _worker_running(self):
+        if fcntl is None or not os.path.exists(self.worker_lock_path):
+            return False
+        with open(self.worker_lock_path, 'a') as lock_file:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                return True
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+            return False
+
+    def _push(self, remote, branch):
+        """Run git push without ever waiting for a credential prompt, returning an error message or None"""
+        env = dict(os.environ, GIT_TERMINAL_PROMPT='0')
+        try:
+            subprocess.run(["git", "push", remote, branch], cwd=self.repo_path, env=env, check=True,
+                           text=True, capture_output=True, stdin=subprocess.DEVNULL, timeout=PUSH_TIMEOUT)
+            return None
+        except subprocess.CalledProcessError as e:
+            return (e.stderr or str(e)).strip()
+        except (OSError, subprocess.TimeoutExpired) as e:
+            return str(e)
+
+    def process_once(self):
+        """
+        Try every queued push once
+
+        Returns:
+            bool: True if the queue is now empty
+        """
+        with locked(self.queue_path):
+            pending = self._read()['pending']
+
+        # Push outside the lock, so --commit can queue more pushes meanwhile
+        results = [(item, self._push(item['remote'], item['branch'])) for item in pending]
+
+        with locked(self.queue_path):
+            state = self._read()
+            errors = []
+            for item, error in results:
+                if error:
+                    errors.append(f"{item['remote']}/{item['branch']}: {error}")
+                    continue
+                state['last_push'] = {'remote': item['remote'], 'branch': item['branch'],
+                                      'commit': item['commit'], 'pushed_at': time.time()}
+                # Drop the entry unless a newer commit was queued while pushing
+                state['pending'] = [queued for queued in state['pending']
+                                    if not (queued['remote'] == item['remote'] and queued['branch'] == item['branch']
+                                            and queued['commit'] == item['commit'])]
+            if errors:
+                state['attempts'] += 1
+                state['last_error'] = '\n'.join(errors)
+                state['next_attempt_at'] = time.time() + min(MAX_DELAY, BASE_DELAY * 2 ** (state['attempts'] - 1))
+            else:
+                state['attempts'] = 0
+                state['next_attempt_at'] = 0
+                state['last_error'] = None
+            self._write(state)
+            return not state['pending']
+
+    def run(self):
+        """Drain the queue, waiting out the backoff between attempts, unless another worker already is"""
+        if fcntl is None:
+            self._drain()
+            return
+
+        with open(self.worker_lock_path, 'a') as worker_lock:
+            try:
+                fcntl.flock(worker_lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                return
+            try:
+                self._drain(worker_lock)
+            finally:
+                fcntl.flock(worker_lock, fcntl.LOCK_UN)
+
+    def _drain(self, worker_lock=None):
+        while True:
+            with locked(self.queue_path):
+                state = self._read()
+                if not state['pending'] or state['attempts'] >= MAX_ATTEMPTS:
+                    # Give up the worker lock while the queue is still locked, so a push
+                    # queued right after this check starts a worker of its own
+                    if worker_lock is not None:
+                        fcntl.flock(worker_lock, fcntl.LOCK_UN)
+                    return
+                wait = state['next_attempt_at'] - time.time()
+            if wait > 0:
+                # Wake up regularly, a newly queued push resets the backoff
+                time.sleep(min(wait, 1.0))
+                continue
+            self.process_once()
+
+    def start_worker(self):
+        """Start a detached worker process that drains the queue, if none is running"""
+        if fcntl is None:
+            # No way to keep a single worker without file locks, push in this process instead
+            self.run()
+            return
+        if self._worker_running():
+            return
+        # Run as a module from the project root, so the worker can import src
+        project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        subprocess.Popen(
+            [sys.executable, '-m', 'src.scrapers.push_queue', self.queue_path, self.repo_path],
+            cwd=project_root, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL, start_new_session=True
+        )
+
+
+def print_push_status(state):
+    """Print the queued pushes and the outcome of the last attempts"""
+    if state['pending']:
+        print(f"{len(state['pending'])} push(es) queued:")
+        for item in state['pending']:
+            queued = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(item['queued_at']))
+            print(f"  {item['remote']}/{item['branch']} at {item['commit'][:10]} "
+                  f"({item['commits']} commit(s), queued {queued})")
+    else:
+        print("No pushes queued.")
+
+    if state['last_error']:
+        print(f"Last push failed after {state['attempts']} attempt(s):")
+        for line in state['last_error'].splitlines():
+            if line.strip():
+                print(f"  {line}")
+        if state['attempts'] >= MAX_ATTEMPTS:
+            print("Gave up retrying, the next --commit will try again.")
+        elif state['next_attempt_at']:
+            retry = time.strftime('%H:%M:%S', time.localtime(state['next_attempt_at']))
+            print(f"Next attempt at {retry}")
+
+    if state['last_push']:
+        pushed = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(state['last_push']['pushed_at']))
+        print(f"Last push: {state['last_push']['remote']}/{state['last_push']['branch']} "
+              f"at {state['last_push']['commit'][:10]} on {pushed}")
+    print(f"Push worker: {'running' if state['worker_running'] else 'not running'}")
+
+
+if __name__ == "__main__":
+    # Entry point of the detached worker started by PushQueue.start_worker
+    PushQueue(sys.argv[1], sys.argv[2]).run()
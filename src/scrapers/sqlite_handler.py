@@ -0,0 +1,192 @@
+import os
+import sqlite3
+from datetime import datetime
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS questions (
+    id TEXT PRIMARY KEY,
+    title TEXT,
+    url TEXT,
+    difficulty TEXT,
+    category TEXT,
+    solution_url TEXT,
+    completed INTEGER NOT NULL DEFAULT 0,
+    date_completed TEXT,
+    position INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_questions_category ON questions (category);
+CREATE INDEX IF NOT EXISTS idx_questions_difficulty ON questions (difficulty);
+CREATE INDEX IF NOT EXISTS idx_questions_completed ON questions (completed, position);
+
+CREATE TABLE IF NOT EXISTS attempts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    question_id TEXT NOT NULL,
+    attempted_at TEXT NOT NULL,
+    passed INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_attempts_question ON attempts (question_id);
+"""
+
+
+class SQLiteHandler:
+    """
+    Tracking store backed by SQLite, with the same interface as CSVHandler
+
+    Status changes are single-row transactional updates instead of full file
+    rewrites, and every test run of a question is recorded in an attempt history.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.ensure_db_exists()
+
+    def _connect(self):
+        connection = sqlite3.connect(self.db_path)
+        connection.row_factory = sqlite3.Row
+        return connection
+
+    def ensure_db_exists(self):
+        """Creates the database and its tables if they don't exist"""
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir and not os.path.exists(db_dir):
+            os.makedirs(db_dir)
+
+        is_new = not os.path.exists(self.db_path)
+        with self._connect() as connection:
+            connection.executescript(SCHEMA)
+        if is_new:
+            print(f"Created new tracking database at {self.db_path}")
+
+    def file_signature(self):
+        """Return (mtime, size, inode) of the database file, or None if it can't be stat'ed"""
+        try:
+            stat = os.stat(self.db_path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def _columns(self, connection):
+        """Return the columns of the questions table, excluding the internal position"""
+        return [row['name'] for row in connection.execute("PRAGMA table_info(questions)")
+                if row['name'] != 'position']
+
+    def read_questions(self):
+        """Reads the questions from the database in curriculum order"""
+        import pandas as pd
+
+        try:
+            with self._connect() as connection:
+                columns = self._columns(connection)
+                select = ', '.join(f'"{column}"' for column in columns)
+                rows = connection.execute(f"SELECT {select} FROM questions ORDER BY position").fetchall()
+            df = pd.DataFrame([tuple(row) for row in rows], columns=columns)
+            df['completed'] = df['completed'].astype(bool)
+            return df
+        except Exception as e:
+            print(f"Error reading database: {e}")
+            return pd.DataFrame()
+
+    def save_questions(self, questions_df):
+        """Replaces all questions with the given DataFrame in a single transaction"""
+        try:
+            with self._connect() as connection:
+                columns = self._columns(connection)
+                # Keep user-added columns by extending the table
+                for column in questions_df.columns:
+                    if column not in columns:
+                        connection.execute(f'ALTER TABLE questions ADD COLUMN "{column}"')
+                        columns.append(column)
+
+                save_columns = [column for column in questions_df.columns if column in columns]
+                records = questions_df[save_columns].astype(object).where(questions_df[save_columns].notna(), None)
+                placeholders = ', '.join('?' for _ in save_columns)
+                names = ', '.join(f'"{column}"' for column in save_columns)
+
+                connection.execute("DELETE FROM questions")
+                connection.executemany(
+                    f"INSERT INTO questions ({names}, position) VALUES ({placeholders}, ?)",
+                    [tuple(self._to_sql(value) for value in row) + (position,)
+                     for position, row in enumerate(records.itertuples(index=False, name=None))]
+                )
+            print(f"Successfully saved {len(questions_df)} questions to {self.db_path}")
+            return True
+        except Exception as e:
+            print(f"Error saving database: {e}")
+            return False
+
+    @staticmethod
+    def _to_sql(value):
+        """Convert pandas/numpy scalars into values sqlite3 accepts"""
+        if hasattr(value, 'item'):
+            return value.item()
+        return value
+
+    def update_question_status(self, question_id, completed=True):
+        """Marks a question as completed"""
+        return self.update_question_statuses([question_id], completed)
+
+    def update_question_statuses(self, question_ids, completed=True):
+        """Marks several questions as completed in one transaction"""
+        date_completed = datetime.now().strftime('%Y-%m-%d') if completed else ''
+        question_ids = list(question_ids)
+        if not question_ids:
+            return False
+        try:
+            with self._connect() as connection:
+                placeholders = ', '.join('?' for _ in question_ids)
+                found = {row['id'] for row in connection.execute(
+                    f"SELECT id FROM questions WHERE id IN ({placeholders})", question_ids)}
+                for question_id in question_ids:
+                    if question_id not in found:
+                        print(f"Question ID {question_id} not found")
+                if not found:
+                    return False
+
+                # Questions already in the requested state keep their completion date
+                connection.executemany(
+                    "UPDATE questions SET completed = ?, date_completed = ? WHERE id = ? AND completed != ?",
+                    [(int(completed), date_completed, question_id, int(completed)) for question_id in found]
+                )
+            return True
+        except sqlite3.Error as e:
+            print(f"Error updating database: {e}")
+            return False
+
+    def record_attempt(self, question_id, passed):
+        """Adds an attempt to the history of a question"""
+        self.record_attempts([(question_id, passed)])
+
+    def record_attempts(self, outcomes):
+        """Adds attempts, given as (question_id, passed) pairs, to the history in one transaction"""
+        attempted_at = datetime.now().isoformat(timespec='seconds')
+        with self._connect() as connection:
+            connection.executemany(
+                "INSERT INTO attempts (question_id, attempted_at, passed) VALUES (?, ?, ?)",
+                [(question_id, attempted_at, int(passed)) for question_id, passed in outcomes]
+            )
+
+    def get_attempts(self, question_id):
+        """Returns the attempt history of a question, oldest first"""
+        with self._connect() as connection:
+            return [dict(row) for row in connection.execute(
+                "SELECT attempted_at, passed FROM attempts WHERE question_id = ? ORDER BY id",
+                (question_id,))]
+
+    def import_csv(self, csv_path):
+        """Replaces the database contents with a questions.csv file"""
+        import pandas as pd
+
+        questions_df = pd.read_csv(csv_path, keep_default_na=False)
+        questions_df['completed'] = questions_df['completed'].astype(str) == 'True'
+        return self.save_questions(questions_df)
+
+    def export_csv(self, csv_path):
+        """Writes the database contents in the questions.csv format"""
+        questions_df = self.read_questions()
+        try:
+            questions_df.to_csv(csv_path, index=False)
+            print(f"Exported {len(questions_df)} questions to {csv_path}")
+            return True
+        except Exception as e:
+            print(f"Error exporting CSV: {e}")
+            return False
@@ -0,0 +1,63 @@
+from src.utils.catalog_snapshots import CatalogSnapshotStore, print_delta
+
+# Columns whose values belong to the user rather than to the fetched catalog
+TRACKING_COLUMNS = ['completed', 'date_completed']
+
+
+def merge_question_catalogs(fetched_df, existing_df):
+    """
+    Merge a freshly fetched catalog into the tracked questions with a keyed join on id
+
+    The fetched catalog decides which questions exist, their order and their
+    details. Completion status and any columns the user added are carried over
+    from the existing questions.
+
+    Args:
+        fetched_df (DataFrame): Questions returned by the scraper
+        existing_df (DataFrame): Questions currently in the tracking store
+
+    Returns:
+        tuple: (merged_df, changes) where changes is the CatalogSnapshotStore.diff
+               of the existing catalog against the fetched one
+    """
+    if existing_df.empty or 'id' not in existing_df.columns:
+        return fetched_df, catalog_changes(fetched_df.iloc[0:0], fetched_df)
+
+    existing_df = existing_df.drop_duplicates('id', keep='first')
+    carried = [column for column in existing_df.columns
+               if column in TRACKING_COLUMNS or column not in fetched_df.columns]
+
+    carried_df = existing_df[['id'] + carried].rename(columns={column: f'{column}__existing' for column in carried})
+    carried_df['_matched'] = True
+    merged = fetched_df.merge(carried_df, on='id', how='left', sort=False)
+    matched = merged.pop('_matched').notna()
+
+    for column in carried:
+        existing_values = merged.pop(f'{column}__existing')
+        if column in fetched_df.columns:
+            merged[column] = existing_values.where(matched, merged[column])
+        else:
+            merged[column] = existing_values
+    if 'completed' in merged.columns:
+        merged['completed'] = merged['completed'].where(merged['completed'].notna(), False).astype(bool)
+
+    # Catalog columns first, in the fetched order, then the user's own columns
+    merged = merged[list(fetched_df.columns) + [column for column in carried if column not in fetched_df.columns]]
+
+    return merged, catalog_changes(existing_df, fetched_df)
+
+
+def catalog_changes(existing_df, fetched_df):
+    """Diff the catalog fields of the existing questions against the fetched ones"""
+    return CatalogSnapshotStore.diff(CatalogSnapshotStore.normalize(existing_df.to_dict('records')),
+                                     CatalogSnapshotStore.normalize(fetched_df.to_dict('records')))
+
+
+def print_catalog_changes(changes, limit=10):
+    """Print a summary of the changes found by merge_question_catalogs"""
+    if not any(changes.values()):
+        print("Catalog unchanged")
+        return
+
+    print("Catalog changes: ", end='')
+    print_delta(changes, limit)
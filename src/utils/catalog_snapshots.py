@@ -0,0 +1,149 @@
+import os
+import json
+import gzip
+import hashlib
+from datetime import datetime
+
+from src.utils.file_modes import write_atomic
+
+# Fields of a catalog question, tracking columns such as completed are not part of the catalog
+CATALOG_FIELDS = ['id', 'title', 'url', 'difficulty', 'category', 'solution_url']
+
+
+class CatalogSnapshotStore:
+    """
+    Versioned snapshots of the fetched NeetCode catalog
+
+    Each distinct catalog is stored once as a gzip-compressed JSON snapshot
+    named after the hash of its content. Every fetch that changes the catalog
+    appends one line to deltas.jsonl with the added, removed and changed
+    problems. A fetch that finds the same catalog writes nothing.
+    """
+
+    def __init__(self, store_dir):
+        """
+        Args:
+            store_dir (str): Directory holding the snapshots and the delta log
+        """
+        self.store_dir = store_dir
+        self.snapshots_dir = os.path.join(store_dir, 'snapshots')
+        self.deltas_path = os.path.join(store_dir, 'deltas.jsonl')
+        self.head_path = os.path.join(store_dir, 'HEAD')
+
+    @staticmethod
+    def normalize(questions):
+        """Keep only the catalog fields of each question, in catalog order"""
+        return [{field: question.get(field, '') for field in CATALOG_FIELDS} for question in questions]
+
+    @staticmethod
+    def content_hash(catalog):
+        canonical = json.dumps(catalog, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def head(self):
+        """Return the hash of the latest snapshot, or None if there is none"""
+        try:
+            with open(self.head_path, 'r') as f:
+                return f.read().strip() or None
+        except OSError:
+            return None
+
+    def _snapshot_path(self, snapshot_hash):
+        return os.path.join(self.snapshots_dir, f"{snapshot_hash}.json.gz")
+
+    def load(self, snapshot_hash):
+        """Return the catalog of a snapshot, given its hash or a unique prefix of it"""
+        snapshot_hash = self.resolve(snapshot_hash)
+        with gzip.open(self._snapshot_path(snapshot_hash), 'rt') as f:
+            return json.load(f)
+
+    def resolve(self, prefix):
+        """Expand a hash prefix to the full hash of a stored snapshot"""
+        names = os.listdir(self.snapshots_dir) if os.path.isdir(self.snapshots_dir) else []
+        matches = [name[:-len('.json.gz')] for name in names
+                   if name.endswith('.json.gz') and name.startswith(prefix)]
+        if len(matches) != 1:
+            raise ValueError(f"{'No' if not matches else 'More than one'} catalog snapshot matches {prefix}")
+        return matches[0]
+
+    @staticmethod
+    def diff(old_catalog, new_catalog):
+        """
+        Compare two catalogs by question ID
+
+        Returns:
+            dict: 'added' and 'removed' question IDs, and 'changed' as a list of
+                  {'id', 'fields': {field: [old, new]}} for questions whose details differ
+        """
+        old_by_id = {question['id']: question for question in old_catalog}
+        new_by_id = {question['id']: question for question in new_catalog}
+        changed = []
+        for question_id, question in new_by_id.items():
+            old = old_by_id.get(question_id)
+            if old is None:
+                continue
+            fields = {field: [old.get(field), question.get(field)]
+                      for field in CATALOG_FIELDS if old.get(field) != question.get(field)}
+            if fields:
+                changed.append({'id': question_id, 'fields': fields})
+        return {
+            'added': [question_id for question_id in new_by_id if question_id not in old_by_id],
+            'removed': [question_id for question_id in old_by_id if question_id not in new_by_id],
+            'changed': changed
+        }
+
+    def record(self, questions):
+        """
+        Snapshot a fetched catalog if it differs from the latest snapshot
+
+        Args:
+            questions (list): Question dicts as fetched
+
+        Returns:
+            dict: The delta that was logged, or None if the catalog is unchanged
+        """
+        catalog = self.normalize(questions)
+        snapshot_hash = self.content_hash(catalog)
+        previous_hash = self.head()
+        if snapshot_hash == previous_hash:
+            return None
+
+        if not os.path.exists(self._snapshot_path(snapshot_hash)):
+            data = json.dumps(catalog, separators=(',', ':'), ensure_ascii=False).encode()
+            write_atomic(self._snapshot_path(snapshot_hash), gzip.compress(data, mtime=0))
+
+        previous = self.load(previous_hash) if previous_hash else []
+        delta = {
+            'date': datetime.now().isoformat(timespec='seconds'),
+            'from': previous_hash,
+            'to': snapshot_hash,
+            'size': len(catalog),
+            **self.diff(previous, catalog)
+        }
+        with open(self.deltas_path, 'a') as f:
+            f.write(json.dumps(delta, ensure_ascii=False) + '\n')
+        write_atomic(self.head_path, (snapshot_hash + '\n').encode())
+        return delta
+
+    def history(self):
+        """Return the logged deltas, oldest first"""
+        try:
+            with open(self.deltas_path, 'r') as f:
+                return [json.loads(line) for line in f if line.strip()]
+        except OSError:
+            return []
+
+
+def print_delta(delta, limit=10):
+    """Print the added, removed and changed problems of a delta"""
+    print(f"{len(delta['added'])} added, {len(delta['removed'])} removed, {len(delta['changed'])} changed")
+    for question_id in delta['added'][:limit]:
+        print(f"  + {question_id}")
+    for question_id in delta['removed'][:limit]:
+        print(f"  - {question_id}")
+    for change in delta['changed'][:limit]:
+        fields = ', '.join(f"{field}: {old!r} -> {new!r}" for field, (old, new) in change['fields'].items())
+        print(f"  ~ {change['id']}: {fields}")
+    hidden = sum(max(0, len(delta[kind]) - limit) for kind in ('added', 'removed', 'changed'))
+    if hidden:
+        print(f"  ... and {hidden} more")
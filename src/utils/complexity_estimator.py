@@ -0,0 +1,300 @@
+import re
+import copy
+import math
+import random
+import string
+import time
+
+from src.utils.solution_tester import SolutionTester, TIME_LIMIT_EXCEEDED
+
+# Candidate complexity classes, simplest first so ties favour the simpler class
+COMPLEXITY_CLASSES = [
+    ('O(1)', lambda n: 1.0),
+    ('O(log n)', lambda n: math.log2(n)),
+    ('O(n)', lambda n: float(n)),
+    ('O(n log n)', lambda n: n * math.log2(n)),
+    ('O(n^2)', lambda n: float(n) ** 2),
+    ('O(n^3)', lambda n: float(n) ** 3),
+    ('O(2^n)', lambda n: 2.0 ** n),
+]
+
+DEFAULT_SIZES = [2 ** i for i in range(6, 17)]
+
+# A declared class whose residual is within this factor of the best fit is
+# treated as consistent, since neighbouring classes such as O(n) and O(n log n)
+# are hard to tell apart on noisy timings
+FIT_TOLERANCE = 1.5
+
+
+class ComplexityEstimator:
+    """
+    Estimates the time complexity of a solution by timing it on inputs of growing size
+    """
+
+    def __init__(self, solution_file_path, sizes=None, repeat=5, time_limit=2.0, seed=0):
+        """
+        Args:
+            solution_file_path (str): Path to the solution file
+            sizes (list): Input sizes n to time the solution at
+            repeat (int): Runs per size, the fastest one is kept
+            time_limit (float): Wall-clock limit per size in seconds, growth stops once it is hit
+            seed (int): Seed for the random input generator
+        """
+        self.solution_file_path = solution_file_path
+        self.sizes = sorted(sizes or DEFAULT_SIZES)
+        self.repeat = max(1, repeat)
+        self.rng = random.Random(seed)
+        self.tester = SolutionTester(solution_file_path, time_limit=time_limit)
+
+    def _scale_value(self, value, n):
+        """
+        Generate a value shaped like the given sample but of size n
+
+        Returns:
+            tuple: (scaled_value, scaled) where scaled tells whether the value depends on n
+        """
+        if isinstance(value, str):
+            alphabet = ''.join(sorted(set(value))) or string.ascii_lowercase
+            return ''.join(self.rng.choice(alphabet) for _ in range(n)), True
+
+        if isinstance(value, list) and value:
+            if all(isinstance(x, bool) for x in value):
+                return [self.rng.random() < 0.5 for _ in range(n)], True
+            if all(isinstance(x, int) for x in value):
+                if len(set(value)) < len(value):
+                    return self._repeat_pattern(value, n), True
+                # Stay within the magnitude of the sample, so arithmetic on the values
+                # (e.g. a running product) costs the same at every n
+                bound = max(abs(x) for x in value)
+                low = -bound if min(value) < 0 else 0
+                return [self.rng.randint(low, bound) for _ in range(n)], True
+            if all(isinstance(x, str) for x in value):
+                length = max(1, round(sum(len(x) for x in value) / len(value)))
+                alphabet = ''.join(sorted(set(''.join(value)))) or string.ascii_lowercase
+                return [''.join(self.rng.choice(alphabet) for _ in range(length))
+                        for _ in range(n)], True
+
+        # Scalars and nested structures (e.g. a fixed 9x9 board) keep their sample value
+        return value, False
+
+    def _repeat_pattern(self, sample, n):
+        """
+        Scale a sample with duplicates to n values with the same duplicate pattern
+
+        Each sample position becomes a block of about n / len(sample) values. The
+        first occurrence of a value gets fresh distinct values and later occurrences
+        repeat them, so duplicates make up the same share of the values and first
+        show up at the same relative position, and duplicate checks cannot exit early.
+        """
+        blocks = {}
+        values = []
+        fresh = min(sample)
+        for i, x in enumerate(sample):
+            size = (i + 1) * n // len(sample) - i * n // len(sample)
+            if not blocks.get(x):
+                blocks[x] = list(range(fresh, fresh + size))
+                fresh += size
+                values.extend(blocks[x])
+            else:
+                block = self.rng.sample(blocks[x], len(blocks[x]))
+                values.extend(block[j % len(block)] for j in range(size))
+        return values
+
+    def generate_input(self, sample_inputs, n):
+        """
+        Generate inputs of size n from the shape of a test case's inputs
+
+        Returns:
+            The generated inputs, or None if nothing in the sample can be scaled
+        """
+        if isinstance(sample_inputs, tuple):
+            scaled = [self._scale_value(value, n) for value in sample_inputs]
+            if not any(was_scaled for _, was_scaled in scaled):
+                return None
+            return tuple(value for value, _ in scaled)
+
+        value, was_scaled = self._scale_value(sample_inputs, n)
+        return value if was_scaled else None
+
+    def _time_size(self, solution_function, inputs):
+        """Time the solution on one input, returning the fastest run in seconds"""
+        repeat = self.repeat
+
+        def timed(*args):
+            best = float('inf')
+            for _ in range(repeat):
+                run_args = copy.deepcopy(args)
+                start = time.perf_counter()
+                solution_function(*run_args)
+                best = min(best, time.perf_counter() - start)
+            return best
+
+        # Run in a supervised child so an exponential blowup hits the time limit
+        verdict, best, error = self.tester.run_case(timed, inputs if isinstance(inputs, tuple) else (inputs,))
+        if verdict == TIME_LIMIT_EXCEEDED:
+            return None
+        if verdict is not None:
+            raise RuntimeError(error[0] if error else verdict)
+        return best
+
+    @staticmethod
+    def fit(sizes, timings):
+        """
+        Fit timings against each complexity class with least squares on t = a + b * f(n)
+
+        Residuals are relative to the measured time so that one noisy run at the
+        largest n cannot outweigh every smaller size.
+
+        Returns:
+            list: (class_name, residual) tuples sorted by residual, best fit first
+        """
+        weights = [1.0 / (t * t) if t > 0 else 1.0 for t in timings]
+        total_weight = sum(weights)
+        mean_t = sum(w * t for w, t in zip(weights, timings)) / total_weight
+        fits = []
+        for name, f in COMPLEXITY_CLASSES:
+            try:
+                xs = [f(n) for n in sizes]
+            except OverflowError:
+                continue
+
+            mean_x = sum(w * x for w, x in zip(weights, xs)) / total_weight
+            var_x = sum(w * (x - mean_x) ** 2 for w, x in zip(weights, xs))
+            if var_x == 0 or not math.isfinite(var_x):
+                # O(1), or a class that cannot be told apart at these sizes
+                if name != 'O(1)':
+                    continue
+                slope = 0.0
+            else:
+                slope = sum(w * (x - mean_x) * (t - mean_t)
+                            for w, x, t in zip(weights, xs, timings)) / var_x
+                slope = max(slope, 0.0)
+            intercept = mean_t - slope * mean_x
+            residual = sum(w * (t - (intercept + slope * x)) ** 2
+                           for w, x, t in zip(weights, xs, timings))
+            fits.append((name, residual))
+
+        # Stable sort keeps the simpler class first on ties
+        return sorted(fits, key=lambda item: item[1])
+
+    @staticmethod
+    def declared_complexity(solution_instance, solution_function):
+        """Extract the declared 'Time Complexity: O(...)' from the solution docstrings"""
+        docstrings = [getattr(solution_function, '__doc__', None)]
+        docstrings += [getattr(getattr(solution_instance, attr), '__doc__', None)
+                       for attr in dir(solution_instance) if not attr.startswith('_')]
+
+        for doc in docstrings:
+            match = re.search(r"Time Complexity:\s*O\(", doc or '')
+            if not match:
+                continue
+            # Take the balanced O(...) expression
+            start = match.end() - 2
+            depth = 0
+            for i in range(match.end() - 1, len(doc)):
+                if doc[i] == '(':
+                    depth += 1
+                elif doc[i] == ')':
+                    depth -= 1
+                    if depth == 0:
+                        return doc[start:i + 1]
+        return None
+
+    @staticmethod
+    def normalize_complexity(declared):
+        """
+        Map a declared complexity to one of the candidate classes in terms of n
+
+        Other variables (k, m, ...) are treated as constants, so O(n * k) maps to O(n).
+        Returns None when the declaration cannot be classified.
+        """
+        if not declared:
+            return None
+        expr = declared[2:-1].lower().replace(' ', '').replace('²', '^2').replace('³', '^3').replace('**', '^')
+
+        if '2^n' in expr:
+            return 'O(2^n)'
+        if 'n^3' in expr or 'n*n*n' in expr:
+            return 'O(n^3)'
+        if 'n^2' in expr or 'n*n' in expr:
+            return 'O(n^2)'
+        if re.search(r"n\*?log\(?n", expr):
+            return 'O(n log n)'
+        if re.search(r"log\(?n", expr) and not re.sub(r"log\(?n\)?", '', expr).count('n'):
+            return 'O(log n)'
+        if 'n' in expr:
+            return 'O(n)'
+        if expr == '1':
+            return 'O(1)'
+        return None
+
+    def estimate(self):
+        """
+        Time the solution on growing inputs and fit the timings
+
+        Returns:
+            dict: The measurements, the best fit and the declared complexity, or None on failure
+        """
+        test_cases = self.tester.get_test_cases()
+        solution_function = self.tester.get_solution_function()
+        if not test_cases or solution_function is None:
+            print("Nothing to estimate")
+            return None
+
+        sample_inputs = test_cases[0][0]
+        if self.generate_input(sample_inputs, 1) is None:
+            print("Cannot scale the inputs of this solution (no list or string input found)")
+            return None
+
+        sizes, timings = [], []
+        for n in self.sizes:
+            inputs = self.generate_input(sample_inputs, n)
+            try:
+                elapsed = self._time_size(solution_function, inputs)
+            except Exception as e:
+                print(f"n={n}: Error - {e}")
+                break
+            if elapsed is None:
+                print(f"n={n}: exceeded the time limit, stopping here")
+                break
+            sizes.append(n)
+            timings.append(elapsed)
+
+        if len(sizes) < 4:
+            print("Not enough measurements to fit a complexity class, try smaller --sizes")
+            return None
+
+        fits = self.fit(sizes, timings)
+        declared = self.declared_complexity(self.tester.solution_instance, solution_function)
+        declared_class = self.normalize_complexity(declared)
+        best_fit, best_residual = fits[0]
+        residuals = dict(fits)
+        consistent = (declared_class in residuals and
+                      residuals[declared_class] <= best_residual * FIT_TOLERANCE)
+
+        return {
+            'sizes': sizes,
+            'timings': timings,
+            'fits': fits,
+            'best_fit': best_fit,
+            'declared': declared,
+            'declared_class': declared_class,
+            'mismatch': declared_class is not None and not consistent
+        }
+
+    @staticmethod
+    def print_report(result):
+        """Print the measurements and the fitted complexity next to the declared one"""
+        print(f"\n{'n':>8}  {'time (µs)':>12}")
+        for n, t in zip(result['sizes'], result['timings']):
+            print(f"{n:>8}  {t * 1e6:>12.2f}")
+
+        print(f"\nBest fit: {result['best_fit']}")
+        print(f"Declared: {result['declared'] or 'not found'}"
+              + (f" (as {result['declared_class']})" if result['declared_class'] else ''))
+        if result['mismatch']:
+            print(f"MISMATCH: declared {result['declared_class']} but measured {result['best_fit']}")
+        elif result['declared_class'] == result['best_fit']:
+            print("Declared complexity matches the measurements")
+        elif result['declared_class']:
+            print("Declared complexity is consistent with the measurements")
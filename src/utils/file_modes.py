@@ -0,0 +1,101 @@
+import os
+import stat
+import tempfile
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows
+    fcntl = None
+
+# Read once, os.umask can only be read by setting it, which isn't thread-safe
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def copy_mode(tmp_path, path):
+    """
+    Give a temporary file the permissions of the file it is about to replace
+
+    tempfile.mkstemp creates files readable by their owner only, so a file
+    replaced by os.replace would otherwise lose its group and other
+    permissions. A file that doesn't exist yet gets the permissions open()
+    would have given it under the current umask.
+
+    Args:
+        tmp_path (str): Temporary file that will be renamed over path
+        path (str): File being replaced
+    """
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = 0o666 & ~_UMASK
+    os.chmod(tmp_path, mode)
+
+
+@contextmanager
+def temporary_file(directory, mode='wb'):
+    """
+    Create a temporary file in a directory, for a file only known once it is written
+
+    The temporary file is removed when the block exits, unless it was moved
+    into place with replace() first, so a failed write leaves nothing behind.
+
+    Yields:
+        tuple: (file, tmp_path)
+    """
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, mode) as f:
+            yield f, tmp_path
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def replace(tmp_path, path):
+    """Move a closed temporary file over path, keeping the permissions of the file it replaces"""
+    copy_mode(tmp_path, path)
+    os.replace(tmp_path, path)
+
+
+def write_atomic(path, data, fsync=False):
+    """
+    Write a file through a temporary file renamed over it, so readers never see a partial file
+
+    Args:
+        path (str): File to write
+        data (str or bytes): Contents of the file, strings are encoded as UTF-8
+        fsync (bool): Flush the contents to disk before the rename
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    with temporary_file(os.path.dirname(os.path.abspath(path))) as (f, tmp_path):
+        f.write(data)
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+        f.close()
+        replace(tmp_path, path)
+
+
+@contextmanager
+def locked(path):
+    """
+    Hold an exclusive lock on a file for a read-modify-write cycle
+
+    A sidecar file (path + '.lock') is locked, since files written with
+    write_atomic are replaced on every write. Without fcntl (Windows) this
+    does nothing.
+    """
+    if fcntl is None:
+        yield
+        return
+
+    with open(path + '.lock', 'w') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
@@ -0,0 +1,335 @@
+import os
+import json
+import gzip
+import time
+import hashlib
+import threading
+
+from src.utils.file_modes import replace, temporary_file, write_atomic
+
+NORMAL = 'normal'
+CACHE_ONLY = 'cache-only'
+REFRESH = 'refresh'
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Freshness per endpoint in seconds, matched on the longest URL prefix
+DEFAULT_TTLS = {
+    'https://neetcode.io/main.js': 24 * 60 * 60,
+    'https://leetcode.com/graphql': 30 * 24 * 60 * 60,
+}
+DEFAULT_TTL = 60 * 60
+
+
+class CacheMiss(Exception):
+    """Raised in cache-only mode when a response isn't cached"""
+
+
+class CachedResponse:
+    """
+    A cached response with the parts of the requests.Response interface the scrapers use
+
+    The body is only decompressed when it is accessed, so callers that can
+    decide from body_hash alone never read it.
+    """
+
+    def __init__(self, url, status_code, headers, body_path, body_hash):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.body_path = body_path
+        self.body_hash = body_hash
+        self.from_cache = True
+        self.revalidated = False
+        self._content = None
+
+    @property
+    def content(self):
+        if self._content is None:
+            with gzip.open(self.body_path, 'rb') as f:
+                self._content = f.read()
+        return self._content
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self):
+        return json.loads(self.content)
+
+    def iter_content(self, chunk_size=STREAM_CHUNK_SIZE):
+        """Yield the decompressed body in chunks without reading all of it into memory"""
+        if self._content is not None:
+            for i in range(0, len(self._content), chunk_size):
+                yield self._content[i:i + chunk_size]
+            return
+        with gzip.open(self.body_path, 'rb') as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+
+    def raise_for_status(self):
+        pass
+
+
+class HTTPCache:
+    """
+    On-disk cache of HTTP responses
+
+    Entries are keyed by a hash of the request (method, URL and JSON body) and
+    point at a gzip-compressed body stored under the hash of its content, so
+    identical responses are stored once. The cache is bounded in size and
+    evicts the least recently used entries, using the entry file mtime as the
+    access time.
+    """
+
+    def __init__(self, cache_dir, mode=NORMAL, max_bytes=DEFAULT_MAX_BYTES, ttls=None):
+        """
+        Args:
+            cache_dir (str): Directory holding the cache
+            mode (str): NORMAL, CACHE_ONLY (never go to the network) or REFRESH (ignore cached entries)
+            max_bytes (int): Maximum total size of the compressed bodies
+            ttls (dict): URL prefix -> seconds a response stays fresh (default: DEFAULT_TTLS)
+        """
+        self.cache_dir = cache_dir
+        self.entries_dir = os.path.join(cache_dir, 'entries')
+        self.bodies_dir = os.path.join(cache_dir, 'bodies')
+        self.mode = mode
+        self.max_bytes = max_bytes
+        self.ttls = DEFAULT_TTLS if ttls is None else ttls
+        # Total body size, computed on the first write
+        self._total_bytes = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(method, url, json_body=None):
+        """Return the cache key of a request"""
+        request = json.dumps([method.upper(), url, json_body], sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(request.encode()).hexdigest()
+
+    def ttl_for(self, url):
+        """Return the freshness lifetime of a URL's responses in seconds"""
+        prefixes = [prefix for prefix in self.ttls if url.startswith(prefix)]
+        return self.ttls[max(prefixes, key=len)] if prefixes else DEFAULT_TTL
+
+    def _entry_path(self, key):
+        return os.path.join(self.entries_dir, f"{key}.json")
+
+    def _body_path(self, body_hash):
+        return os.path.join(self.bodies_dir, f"{body_hash}.gz")
+
+    def _read_entry(self, key):
+        try:
+            with open(self._entry_path(key), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def lookup(self, key, url, ttl=None):
+        """
+        Return the cached response of a request, or None if there is no fresh one
+
+        In cache-only mode stale entries are returned too and a missing entry
+        raises CacheMiss. In refresh mode nothing is returned.
+        """
+        if self.mode == REFRESH:
+            return None
+
+        entry = self._read_entry(key)
+        if entry is None:
+            if self.mode == CACHE_ONLY:
+                raise CacheMiss(f"{url} is not cached")
+            return None
+
+        ttl = self.ttl_for(url) if ttl is None else ttl
+        if self.mode != CACHE_ONLY and time.time() - entry['stored_at'] > ttl:
+            return None
+
+        if not os.path.exists(self._body_path(entry['body_hash'])):
+            if self.mode == CACHE_ONLY:
+                raise CacheMiss(f"{url} is not cached")
+            return None
+
+        # Mark the entry as recently used
+        os.utime(self._entry_path(key))
+        return self._cached_response(entry)
+
+    def _cached_response(self, entry):
+        return CachedResponse(entry['url'], entry['status_code'], entry['headers'],
+                              self._body_path(entry['body_hash']), entry['body_hash'])
+
+    @staticmethod
+    def _header(headers, name):
+        """Case-insensitive header lookup on a plain dict"""
+        for header, value in headers.items():
+            if header.lower() == name.lower():
+                return value
+        return None
+
+    def _conditional_headers(self, entry):
+        """Return If-None-Match/If-Modified-Since headers revalidating a cached entry"""
+        headers = {}
+        etag = self._header(entry['headers'], 'ETag')
+        last_modified = self._header(entry['headers'], 'Last-Modified')
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def _revalidate(self, key, entry, headers):
+        """Mark a cached entry fresh again after a 304, taking any updated validators"""
+        for name in ('ETag', 'Last-Modified', 'Cache-Control', 'Expires', 'Date'):
+            value = self._header(headers, name)
+            if value:
+                entry['headers'] = {header: old for header, old in entry['headers'].items()
+                                    if header.lower() != name.lower()}
+                entry['headers'][name] = value
+        entry['stored_at'] = time.time()
+        with self._lock:
+            write_atomic(self._entry_path(key), json.dumps(entry).encode())
+
+    def store(self, key, method, url, response):
+        """
+        Cache a successful response
+
+        Returns:
+            str: The hash of the body, or None if the response wasn't cached
+        """
+        if response.status_code != 200:
+            return None
+
+        # Compress and hash the body chunk by chunk, so a streamed response is never fully in memory.
+        # The body is stored under its hash, which is only known once it is written
+        digest = hashlib.sha256()
+        with temporary_file(self.bodies_dir) as (raw_file, tmp_path):
+            with gzip.GzipFile(fileobj=raw_file, mode='wb', mtime=0) as gzip_file:
+                for chunk in response.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                    digest.update(chunk)
+                    gzip_file.write(chunk)
+            raw_file.close()
+
+            body_hash = digest.hexdigest()
+            body_path = self._body_path(body_hash)
+            with self._lock:
+                # If an identical body is already stored, the temporary file is dropped
+                if not os.path.exists(body_path):
+                    replace(tmp_path, body_path)
+                    if self._total_bytes is not None:
+                        self._total_bytes += os.path.getsize(body_path)
+
+                entry = {
+                    'method': method.upper(),
+                    'url': url,
+                    'status_code': response.status_code,
+                    'headers': dict(response.headers),
+                    'body_hash': body_hash,
+                    'stored_at': time.time()
+                }
+                write_atomic(self._entry_path(key), json.dumps(entry).encode())
+
+                if self._total_bytes is None:
+                    self._total_bytes = self._bodies_size()
+                if self._total_bytes > self.max_bytes:
+                    self.evict()
+        return body_hash
+
+    def _bodies_size(self):
+        if not os.path.isdir(self.bodies_dir):
+            return 0
+        return sum(entry.stat().st_size for entry in os.scandir(self.bodies_dir) if entry.name.endswith('.gz'))
+
+    def evict(self, max_bytes=None):
+        """Remove least recently used entries until the bodies fit in max_bytes, then drop unused bodies"""
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        entries = []
+        if os.path.isdir(self.entries_dir):
+            for dir_entry in os.scandir(self.entries_dir):
+                if dir_entry.name.endswith('.json'):
+                    entries.append((dir_entry.stat().st_mtime, dir_entry.path))
+        entries.sort()
+
+        body_sizes = {}
+        if os.path.isdir(self.bodies_dir):
+            body_sizes = {dir_entry.name[:-3]: dir_entry.stat().st_size
+                          for dir_entry in os.scandir(self.bodies_dir) if dir_entry.name.endswith('.gz')}
+
+        referenced = {}
+        ref_counts = {}
+        for _, path in entries:
+            try:
+                with open(path, 'r') as f:
+                    body_hash = json.load(f)['body_hash']
+            except (OSError, ValueError, KeyError):
+                body_hash = None
+            referenced[path] = body_hash
+            ref_counts[body_hash] = ref_counts.get(body_hash, 0) + 1
+
+        total = sum(body_sizes.get(body_hash, 0) for body_hash in ref_counts)
+        # The most recently used entry is always kept
+        for _, path in entries[:-1]:
+            if total <= max_bytes:
+                break
+            os.remove(path)
+            body_hash = referenced.pop(path)
+            ref_counts[body_hash] -= 1
+            if ref_counts[body_hash] == 0:
+                del ref_counts[body_hash]
+                total -= body_sizes.get(body_hash, 0)
+
+        for body_hash in body_sizes:
+            if body_hash not in ref_counts:
+                os.remove(self._body_path(body_hash))
+        self._total_bytes = total
+
+    def fetch(self, session, method, url, json=None, ttl=None, headers=None, **kwargs):
+        """
+        Send a request through the cache
+
+        A stale entry with an ETag or Last-Modified validator is revalidated
+        with a conditional request, and a 304 reuses the cached body. In
+        REFRESH mode no validators are sent, so the full body is fetched again.
+
+        Args:
+            session: requests module or Session used on a cache miss
+            method (str): HTTP method
+            url (str): URL to request
+            json: JSON body of the request, part of the cache key
+            ttl (float): Freshness lifetime in seconds (default: per-endpoint TTL)
+            headers (dict): Request headers
+
+        Returns:
+            The cached or fresh response. Successful responses are returned as a
+            CachedResponse read back from the cache, so they can be streamed with
+            iter_content and carry a body_hash.
+        """
+        key = self.key(method, url, json)
+        cached = self.lookup(key, url, ttl)
+        if cached is not None:
+            return cached
+
+        entry = self._read_entry(key) if self.mode != REFRESH else None
+        if entry is not None and not os.path.exists(self._body_path(entry['body_hash'])):
+            entry = None
+        request_headers = dict(headers or {})
+        if entry is not None:
+            request_headers.update(self._conditional_headers(entry))
+
+        response = session.request(method, url, json=json, headers=request_headers, **kwargs)
+        if response.status_code == 304 and entry is not None:
+            self._revalidate(key, entry, response.headers)
+            cached = self._cached_response(entry)
+            cached.revalidated = True
+            return cached
+
+        body_hash = self.store(key, method, url, response)
+        if body_hash is None:
+            return response
+        # The body may have been streamed into the cache, so read it back from there
+        stored = CachedResponse(url, response.status_code, dict(response.headers),
+                                self._body_path(body_hash), body_hash)
+        stored.from_cache = False
+        return stored
@@ -0,0 +1,283 @@
+import os
+import json
+import heapq
+from datetime import date, timedelta
+
+from src.utils.file_modes import locked, write_atomic
+
+# Question fields kept in the schedule so the next question needs no catalog read
+QUESTION_FIELDS = ['id', 'title', 'url', 'difficulty', 'category', 'solution_url']
+
+# SM-2 parameters
+DEFAULT_EASE = 2.5
+MIN_EASE = 1.3
+PASS_QUALITY = 4
+FAIL_QUALITY = 2
+
+
+class ReviewScheduler:
+    """
+    Orders questions for --new with spaced repetition
+
+    Two heaps are kept: solved questions keyed on the date their next review
+    is due, and unsolved questions keyed on their curriculum position. Due
+    reviews come first, then new questions. Heap entries are invalidated
+    lazily, so recording an outcome only pushes a new entry and stale ones are
+    dropped when they reach the top. The heaps are saved as-is, so the next
+    question is available at startup without rebuilding them. The signature
+    of the tracking file the schedule was last synced with is saved too, so
+    completions made outside the CLI (scripts, --import-csv) are picked up by
+    syncing again once it changes. Changes are made under a lock on the
+    schedule as it is on disk, so the test daemon and the CLI keep each
+    other's outcomes.
+    """
+
+    def __init__(self, schedule_path):
+        """
+        Args:
+            schedule_path (str): Path of the JSON file holding the schedule
+        """
+        self.schedule_path = schedule_path
+        self.items = {}
+        self.review_heap = []
+        self.new_heap = []
+        self.synced_with = None
+        self._signature = None
+        self._load()
+
+    def _file_signature(self):
+        try:
+            stat = os.stat(self.schedule_path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def _load(self):
+        """Load the schedule from disk, starting empty if it doesn't exist or is unreadable"""
+        self._signature = self._file_signature()
+        if self._signature is None:
+            return
+        try:
+            with open(self.schedule_path, 'r') as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Error reading schedule: {e}")
+            return
+
+        self.items = state.get('items', {})
+        # Saved heaps keep their heap order, JSON only turns the tuples into lists
+        self.review_heap = [tuple(entry) for entry in state.get('review_heap', [])]
+        self.new_heap = [tuple(entry) for entry in state.get('new_heap', [])]
+        self.synced_with = state.get('synced_with')
+
+    def reload_if_changed(self):
+        """Reload the schedule if another process saved it since it was loaded"""
+        if self._file_signature() != self._signature:
+            self.items, self.review_heap, self.new_heap, self.synced_with = {}, [], [], None
+            self._load()
+
+    def save(self):
+        """Write the schedule atomically, compacting heaps that are mostly stale entries"""
+        if len(self.review_heap) + len(self.new_heap) > 2 * len(self.items) + 16:
+            self.review_heap = [entry for entry in self.review_heap if self._is_current(entry, self.review_heap)]
+            self.new_heap = [entry for entry in self.new_heap if self._is_current(entry, self.new_heap)]
+            heapq.heapify(self.review_heap)
+            heapq.heapify(self.new_heap)
+
+        write_atomic(self.schedule_path, json.dumps({'items': self.items, 'review_heap': self.review_heap,
+                                                     'new_heap': self.new_heap, 'synced_with': self.synced_with}))
+        self._signature = self._file_signature()
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, question_id):
+        return question_id in self.items
+
+    def sync(self, questions_df, signature=None):
+        """
+        Bring the schedule in line with the tracked questions
+
+        New questions are queued in curriculum order, removed ones are dropped
+        and questions completed while still queued as new (before they were
+        scheduled, or by a script or --import-csv) get their first review one
+        day after their completion date, the same as a first solve.
+
+        Args:
+            questions_df (DataFrame): The tracked questions
+            signature (tuple): (mtime, size, inode) of the tracking file they were read from
+        """
+        with locked(self.schedule_path):
+            # Start from the schedule as saved by any other process meanwhile
+            self.reload_if_changed()
+            self._sync(questions_df, signature)
+
+    def _sync(self, questions_df, signature):
+        synced_with = list(signature) if signature is not None else None
+        items = {}
+        for position, question in enumerate(questions_df.to_dict('records')):
+            question_id = question['id']
+            item = dict(self.items.get(question_id) or {})
+            if not item:
+                item = {'repetitions': 0, 'interval': 0, 'ease': DEFAULT_EASE, 'due': None}
+            if item['due'] is None and question.get('completed') == True:
+                completed_on = self._parse_date(question.get('date_completed'))
+                item.update(repetitions=1, interval=1, due=(completed_on + timedelta(days=1)).isoformat())
+            item.update({field: self._to_json(question.get(field)) for field in QUESTION_FIELDS})
+            item['position'] = position
+            items[question_id] = item
+
+        if items == self.items and synced_with == self.synced_with and os.path.exists(self.schedule_path):
+            # Nothing changed, keep the heaps and skip the write
+            return
+        self.items = items
+        self.synced_with = synced_with
+        self.review_heap = [(item['due'], item['position'], question_id)
+                            for question_id, item in items.items() if item['due'] is not None]
+        self.new_heap = [(item['position'], question_id)
+                         for question_id, item in items.items() if item['due'] is None]
+        heapq.heapify(self.review_heap)
+        heapq.heapify(self.new_heap)
+        self.save()
+
+    @staticmethod
+    def _to_json(value):
+        """Turn pandas missing values and numpy scalars into plain JSON values"""
+        if value is None or value != value:
+            return ''
+        return value.item() if hasattr(value, 'item') else value
+
+    @staticmethod
+    def _parse_date(value):
+        try:
+            return date.fromisoformat(str(value))
+        except ValueError:
+            return date.today()
+
+    def _is_current(self, entry, heap):
+        """Whether a heap entry still describes its item"""
+        question_id = entry[-1]
+        item = self.items.get(question_id)
+        if item is None:
+            return False
+        if heap is self.review_heap:
+            return item['due'] == entry[0] and item['position'] == entry[1]
+        return item['due'] is None and item['position'] == entry[0]
+
+    def _top(self, heap):
+        """Drop stale entries and return the top of a heap, or None if it is empty"""
+        while heap and not self._is_current(heap[0], heap):
+            heapq.heappop(heap)
+        return heap[0] if heap else None
+
+    def _matches(self, question_id, category, difficulty):
+        item = self.items[question_id]
+        return ((not category or item['category'] == category) and
+                (not difficulty or item['difficulty'] == difficulty))
+
+    def _first_match(self, heap, category, difficulty):
+        """
+        Return the first current entry of a heap matching the filters
+
+        Without filters this is the top of the heap. With filters, entries are
+        popped until one matches and the skipped ones are pushed back.
+        """
+        skipped = []
+        found = None
+        while self._top(heap) is not None:
+            if self._matches(heap[0][-1], category, difficulty):
+                found = heap[0]
+                break
+            skipped.append(heapq.heappop(heap))
+        for entry in skipped:
+            heapq.heappush(heap, entry)
+        return found
+
+    def next_question(self, category=None, difficulty=None, today=None):
+        """
+        Return the next question to work on, or None if nothing matches
+
+        A review that is due wins over a new question. The question stays
+        scheduled until an outcome is recorded for it.
+
+        Returns:
+            dict: The question fields plus 'review' telling whether it is a review
+        """
+        today = (today or date.today()).isoformat()
+        entry = self._first_match(self.review_heap, category, difficulty)
+        review = entry is not None and entry[0] <= today
+        if not review:
+            entry = self._first_match(self.new_heap, category, difficulty)
+        if entry is None:
+            return None
+
+        item = self.items[entry[-1]]
+        question = {field: item[field] for field in QUESTION_FIELDS}
+        question['review'] = review
+        return question
+
+    def record_outcome(self, question_id, passed, today=None):
+        """
+        Update a question's SM-2 state after a test run and reschedule it
+
+        Only a review that is due, or a first solve, moves the schedule on:
+        running the tests again before the next review leaves it as it is.
+        A failure on a question that was never solved leaves it in the new
+        queue, since that is still a first attempt.
+
+        Returns:
+            str: The ISO date of the next review, or None if nothing was scheduled
+        """
+        return self.record_outcomes([(question_id, passed)], today).get(question_id)
+
+    def record_outcomes(self, outcomes, today=None):
+        """
+        Record the outcomes of several test runs with a single write
+
+        Args:
+            outcomes (iterable): (question_id, passed) pairs
+
+        Returns:
+            dict: The ISO date of the next review of each question that has one
+        """
+        with locked(self.schedule_path):
+            # Apply the outcomes to the schedule as saved by any other process meanwhile
+            self.reload_if_changed()
+            return self._record_outcomes(outcomes, today or date.today())
+
+    def _record_outcomes(self, outcomes, today):
+        next_reviews = {}
+        changed = False
+        for question_id, passed in outcomes:
+            item = self.items.get(question_id)
+            if item is None:
+                print(f"Question ID {question_id} is not scheduled, run --fetch to sync the schedule")
+                continue
+            if item['due'] is None and not passed:
+                continue
+            if item['due'] is None or item['due'] <= today.isoformat():
+                self._advance(question_id, item, passed, today)
+                changed = True
+            next_reviews[question_id] = item['due']
+        if changed:
+            self.save()
+        return next_reviews
+
+    def _advance(self, question_id, item, passed, today):
+        """Apply one SM-2 step to an item and push its new heap entry"""
+        quality = PASS_QUALITY if passed else FAIL_QUALITY
+        if passed:
+            item['repetitions'] += 1
+            if item['repetitions'] == 1:
+                item['interval'] = 1
+            elif item['repetitions'] == 2:
+                item['interval'] = 6
+            else:
+                item['interval'] = round(item['interval'] * item['ease'])
+        else:
+            item['repetitions'] = 0
+            item['interval'] = 1
+        item['ease'] = max(MIN_EASE, item['ease'] + 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
+
+        item['due'] = (today + timedelta(days=item['interval'])).isoformat()
+        heapq.heappush(self.review_heap, (item['due'], item['position'], question_id))
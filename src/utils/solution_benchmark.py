@@ -0,0 +1,176 @@
+import os
+import gc
+import copy
+import json
+import math
+import statistics
+import time
+from datetime import datetime
+
+from src.utils.solution_tester import SolutionTester
+
+
+class SolutionBenchmark:
+    """
+    Times every test case of a solution over warmup and measured runs
+    """
+
+    def __init__(self, solution_file_path, warmup=5, repeat=50, disable_gc=False, cpu=None, reject_outliers=True):
+        """
+        Args:
+            solution_file_path (str): Path to the solution file
+            warmup (int): Number of untimed runs per test case
+            repeat (int): Number of timed runs per test case
+            disable_gc (bool): Disable the garbage collector while timing
+            cpu (int): CPU to pin the process to while timing (None to leave unpinned)
+            reject_outliers (bool): Leave slow outlier runs out of the statistics
+        """
+        self.solution_file_path = solution_file_path
+        self.warmup = warmup
+        self.repeat = max(1, repeat)
+        self.disable_gc = disable_gc
+        self.cpu = cpu
+        self.reject_outliers = reject_outliers
+        self.tester = SolutionTester(solution_file_path)
+
+    @staticmethod
+    def split_outliers(timings_ns):
+        """
+        Separate slow outliers from a list of timings
+
+        A run is an outlier if it is slower than Q3 + 1.5 * IQR (Tukey's fence).
+        Only slow runs are rejected, since interrupts, page faults and other
+        processes can make a run slower but never faster.
+
+        Returns:
+            tuple: (kept timings, number of rejected runs)
+        """
+        if len(timings_ns) < 4:
+            return list(timings_ns), 0
+        q1, _, q3 = statistics.quantiles(timings_ns, n=4)
+        fence = q3 + 1.5 * (q3 - q1)
+        kept = [timing for timing in timings_ns if timing <= fence]
+        return kept, len(timings_ns) - len(kept)
+
+    @staticmethod
+    def summarize(timings_ns, outliers=0):
+        """
+        Summarize a list of timings
+
+        Args:
+            timings_ns (list): Timings in nanoseconds
+            outliers (int): Number of runs rejected as outliers before summarizing
+
+        Returns:
+            dict: min, median, p95 and stddev in nanoseconds
+        """
+        ordered = sorted(timings_ns)
+        # Nearest-rank percentile
+        p95_index = max(0, math.ceil(0.95 * len(ordered)) - 1)
+        return {
+            'runs': len(ordered),
+            'min_ns': ordered[0],
+            'median_ns': statistics.median(ordered),
+            'p95_ns': ordered[p95_index],
+            'stddev_ns': statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+            'outliers': outliers
+        }
+
+    def _pin_cpu(self):
+        """Pin the process to the configured CPU, returning the previous affinity"""
+        if self.cpu is None:
+            return None
+        if not hasattr(os, 'sched_setaffinity'):
+            print("CPU pinning is not supported on this platform")
+            return None
+
+        previous = os.sched_getaffinity(0)
+        try:
+            os.sched_setaffinity(0, {self.cpu})
+        except OSError as e:
+            print(f"Could not pin to CPU {self.cpu}: {e}. Running unpinned")
+            return None
+        return previous
+
+    def _time_case(self, solution_function, inputs):
+        """Time one test case, returning the measured run timings in nanoseconds"""
+        # Solutions may mutate their inputs, so every run gets a fresh copy
+        for _ in range(self.warmup):
+            SolutionTester.call_solution(solution_function, copy.deepcopy(inputs))
+
+        timings = []
+        for _ in range(self.repeat):
+            run_inputs = copy.deepcopy(inputs)
+            start = time.perf_counter_ns()
+            SolutionTester.call_solution(solution_function, run_inputs)
+            timings.append(time.perf_counter_ns() - start)
+        return timings
+
+    def run(self):
+        """
+        Benchmark every test case
+
+        Returns:
+            dict: The benchmark results, or None if the solution could not be run
+        """
+        test_cases = self.tester.get_test_cases()
+        solution_function = self.tester.get_solution_function()
+        if not test_cases or solution_function is None:
+            print("Nothing to benchmark")
+            return None
+
+        previous_affinity = self._pin_cpu()
+        gc_was_enabled = gc.isenabled()
+        if self.disable_gc:
+            gc.disable()
+
+        cases = []
+        try:
+            for i, (inputs, expected) in enumerate(test_cases):
+                try:
+                    timings = self._time_case(solution_function, inputs)
+                except Exception as e:
+                    print(f"Test {i+1}: Error - {e}")
+                    cases.append({'case': i + 1, 'error': str(e)})
+                    continue
+                outliers = 0
+                if self.reject_outliers:
+                    timings, outliers = self.split_outliers(timings)
+                cases.append({'case': i + 1, **self.summarize(timings, outliers)})
+        finally:
+            if self.disable_gc and gc_was_enabled:
+                gc.enable()
+            if previous_affinity is not None:
+                os.sched_setaffinity(0, previous_affinity)
+
+        return {
+            'solution': os.path.basename(self.solution_file_path),
+            'date': datetime.now().isoformat(timespec='seconds'),
+            'warmup': self.warmup,
+            'repeat': self.repeat,
+            'gc_disabled': self.disable_gc,
+            'cpu': self.cpu,
+            'outliers_rejected': self.reject_outliers,
+            'cases': cases
+        }
+
+    @staticmethod
+    def print_report(results):
+        """Print the benchmark results as a table in microseconds"""
+        print(f"\nBenchmark for {results['solution']} "
+              f"({results['warmup']} warmup, {results['repeat']} measured runs)")
+        print(f"{'Case':>4}  {'min':>10}  {'median':>10}  {'p95':>10}  {'stddev':>10}  {'outliers':>8}  (µs)")
+        for case in results['cases']:
+            if 'error' in case:
+                print(f"{case['case']:>4}  error: {case['error']}")
+                continue
+            print(f"{case['case']:>4}  {case['min_ns'] / 1000:>10.2f}  {case['median_ns'] / 1000:>10.2f}  "
+                  f"{case['p95_ns'] / 1000:>10.2f}  {case['stddev_ns'] / 1000:>10.2f}  {case['outliers']:>8}")
+
+    def save_results(self, results):
+        """Write the results as JSON next to the solution file"""
+        results_path = os.path.splitext(self.solution_file_path)[0] + "_bench.json"
+        with open(results_path, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Benchmark results saved to {results_path}")
+        return results_path
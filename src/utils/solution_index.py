@@ -0,0 +1,89 @@
+import os
+import json
+
+from src.utils.file_modes import locked, write_atomic
+
+
+class SolutionIndex:
+    """
+    Persistent mapping from solution file path to question ID
+
+    Paths are stored relative to the project root with forward slashes, so
+    the index stays valid when the repository is cloned elsewhere. Changes
+    are merged into the file as it is on disk under a lock, so processes
+    sharing the index (e.g. the test daemon and the CLI) keep each other's
+    entries.
+    """
+
+    def __init__(self, index_path, root):
+        """
+        Args:
+            index_path (str): Path of the JSON file holding the index
+            root (str): Directory that the stored paths are relative to
+        """
+        self.index_path = index_path
+        self.root = os.path.abspath(root)
+        self._signature = None
+        self.entries = self._load()
+
+    def _file_signature(self):
+        try:
+            stat = os.stat(self.index_path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def _load(self):
+        """Load the index from disk, starting empty if it doesn't exist or is unreadable"""
+        self._signature = self._file_signature()
+        if self._signature is None:
+            return {}
+        try:
+            with open(self.index_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Error reading solution index: {e}")
+            return {}
+
+    def reload_if_changed(self):
+        """Reload the index if another process saved it since it was loaded"""
+        if self._file_signature() != self._signature:
+            self.entries = self._load()
+
+    def save(self):
+        """Write the index atomically"""
+        write_atomic(self.index_path, json.dumps(self.entries, indent=2, sort_keys=True) + '\n')
+        self._signature = self._file_signature()
+
+    def _key(self, solution_path):
+        relative_path = os.path.relpath(os.path.abspath(solution_path), self.root)
+        return relative_path.replace(os.sep, '/')
+
+    def lookup(self, solution_path):
+        """Return the question ID of a solution file, or None if it isn't indexed"""
+        self.reload_if_changed()
+        return self.entries.get(self._key(solution_path))
+
+    def add(self, solution_path, question_id):
+        """Index a solution file, saving only if the entry changed"""
+        key = self._key(solution_path)
+        with locked(self.index_path):
+            # Merge into the index as saved by any other process meanwhile
+            self.reload_if_changed()
+            if self.entries.get(key) != question_id:
+                self.entries[key] = question_id
+                self.save()
+
+    def rebuild(self, entries):
+        """
+        Replace the whole index
+
+        Args:
+            entries (iterable): (solution_path, question_id) pairs
+        """
+        with locked(self.index_path):
+            self.entries = {self._key(path): question_id for path, question_id in entries}
+            self.save()
+
+    def __len__(self):
+        return len(self.entries)
@@ -1,13 +1,169 @@
 import os
+import io
+import json
+import math
+import hashlib
 import importlib.util
+import multiprocessing
+import signal
 import sys
 import traceback
+import tracemalloc
+from contextlib import redirect_stdout, redirect_stderr
+
+from src.utils.verdict_cache import VerdictCache
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+# Verdicts for a single test case, named like LeetCode's
+ACCEPTED = "AC"
+WRONG_ANSWER = "WA"
+RUNTIME_ERROR = "RE"
+TIME_LIMIT_EXCEEDED = "TLE"
+MEMORY_LIMIT_EXCEEDED = "MLE"
+
+# Part of every verdict cache key. Bump it when a change to the tester can change
+# verdicts, so verdicts cached by the old tester are not reused.
+TESTER_VERSION = 1
+
+
+def _current_address_space():
+    """Return the address space already used by this process in bytes (0 if unknown)"""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[0]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def _apply_limits(time_limit, memory_limit_mb):
+    """Apply CPU time and address space rlimits to the current process"""
+    if resource is None:
+        return
+    
+    if time_limit:
+        # Backstop for the wall-clock timeout enforced by the parent
+        cpu_seconds = math.ceil(time_limit) + 1
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds, cpu_seconds + 1))
+    
+    if memory_limit_mb:
+        # The cap applies on top of what the (forked) interpreter already maps
+        limit = _current_address_space() + memory_limit_mb * 1024 * 1024
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        if hard != resource.RLIM_INFINITY:
+            limit = min(limit, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def _profile_call(solution_function, inputs, solution_file_path, top_sites=5):
+    """
+    Call the solution while tracing its memory allocations with tracemalloc
+    
+    Allocation sites are captured when the outermost solution frame returns,
+    while its local variables are still alive.
+    
+    Returns:
+        tuple: (actual, memory_profile)
+    """
+    depth = 0
+    captured = {}
+    # Code objects may carry either the given or the absolute path
+    filenames = {solution_file_path, os.path.abspath(solution_file_path)}
+    
+    def trace_solution_frame(frame, event, arg):
+        nonlocal depth
+        if event == 'return':
+            depth -= 1
+            if depth == 0:
+                captured['peak'] = tracemalloc.get_traced_memory()[1]
+                captured['snapshot'] = tracemalloc.take_snapshot()
+        return trace_solution_frame
+    
+    def trace_calls(frame, event, arg):
+        nonlocal depth
+        if event == 'call' and frame.f_code.co_filename in filenames:
+            captured['filename'] = frame.f_code.co_filename
+            depth += 1
+            return trace_solution_frame
+        return None
+    
+    tracemalloc.start()
+    sys.settrace(trace_calls)
+    try:
+        actual = SolutionTester.call_solution(solution_function, inputs)
+    finally:
+        sys.settrace(None)
+        if 'snapshot' not in captured:
+            captured['peak'] = tracemalloc.get_traced_memory()[1]
+            captured['snapshot'] = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+    
+    filename = captured.get('filename', solution_file_path)
+    snapshot = captured['snapshot'].filter_traces([tracemalloc.Filter(True, filename)])
+    stats = snapshot.statistics('lineno')
+    memory_profile = {
+        'peak_bytes': captured['peak'],
+        'allocations': sum(stat.count for stat in stats),
+        'allocated_bytes': sum(stat.size for stat in stats),
+        'top_sites': [
+            (os.path.basename(stat.traceback[0].filename), stat.traceback[0].lineno, stat.size, stat.count)
+            for stat in stats[:top_sites]
+        ]
+    }
+    return actual, memory_profile
+
+
+def _call_case(solution_function, inputs, profile_path=None):
+    """Call the solution, profiling its memory when profile_path is set"""
+    if profile_path is None:
+        return SolutionTester.call_solution(solution_function, inputs), None
+    return _profile_call(solution_function, inputs, profile_path)
+
+
+def _format_bytes(size):
+    """Format a byte count for display"""
+    for unit in ('B', 'KiB', 'MiB'):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def _execute_limited(connection, solution_function, inputs, time_limit, memory_limit_mb, profile_path=None):
+    """Child process entry point: run one test case under rlimits and send back the outcome"""
+    try:
+        _apply_limits(time_limit, memory_limit_mb)
+        connection.send(('ok', _call_case(solution_function, inputs, profile_path)))
+    except MemoryError:
+        connection.send(('mle', None))
+    except Exception as e:
+        connection.send(('error', (str(e), traceback.format_exc())))
+    finally:
+        connection.close()
+
 
 class SolutionTester:
-    def __init__(self, solution_file_path):
+    def __init__(self, solution_file_path, time_limit=None, memory_limit_mb=None, profile_memory=False):
+        """
+        Args:
+            solution_file_path (str): Path to the solution file
+            time_limit (float): Wall-clock limit per test case in seconds (None for no limit)
+            memory_limit_mb (int): Extra address space allowed per test case in MB (None for no limit)
+            profile_memory (bool): Measure peak memory and allocation sites of each test case
+        """
         self.solution_file_path = solution_file_path
+        self.time_limit = time_limit
+        self.memory_limit_mb = memory_limit_mb
+        self.profile_memory = profile_memory
+        self.memory_profiles = []
         self.solution_module = None
         self.solution_instance = None
+        self.verdicts = []
+        # Whether the last run_tests reused cached verdicts instead of running the tests
+        self.from_cache = False
         self._load_solution()
         
     def _load_solution(self):
@@ -34,64 +190,253 @@ class SolutionTester:
             print(f"Error loading solution: {e}")
             traceback.print_exc()
     
-    def run_tests(self):
-        """Run the tests from the solution module"""
+    def get_solution_function(self):
+        """Detect the solution function of the loaded Solution instance"""
         if not self.solution_instance:
             print("No solution instance available")
-            return False
+            return None
+        
+        # Try to automatically detect the solution function
+        solution_functions = [attr for attr in dir(self.solution_instance) 
+                             if callable(getattr(self.solution_instance, attr)) and 
+                             not attr.startswith('_') and 
+                             attr != 'get_test_cases']
+        
+        if not solution_functions:
+            print("No solution function found")
+            return None
+            
+        return getattr(self.solution_instance, solution_functions[0])
+    
+    def get_test_cases(self):
+        """Return the test cases of the loaded Solution instance"""
+        if not self.solution_instance:
+            print("No solution instance available")
+            return []
             
         if not hasattr(self.solution_instance, "get_test_cases"):
             print("Solution instance does not have get_test_cases method")
+            return []
+            
+        return self.solution_instance.get_test_cases() or []
+    
+    @staticmethod
+    def call_solution(solution_function, inputs):
+        """Call the solution function with the test case inputs"""
+        # Handle different types of inputs (single value or list of values)
+        if isinstance(inputs, tuple):
+            return solution_function(*inputs)
+        elif isinstance(inputs, list) and all(isinstance(x, dict) for x in inputs):
+            # Special case for LeetCode-style list of objects
+            return solution_function(inputs)
+        else:
+            return solution_function(inputs)
+    
+    def run_case(self, solution_function, inputs):
+        """
+        Run a single test case, isolated in a child process when limits are set
+        
+        The memory profile of the case, if enabled, is left in self.memory_profile.
+        
+        Returns:
+            tuple: (verdict, actual, error) where verdict is None if the case ran to completion
+        """
+        self.memory_profile = None
+        profile_path = self.solution_file_path if self.profile_memory else None
+        
+        isolated = self.time_limit is not None or self.memory_limit_mb is not None
+        if not isolated or 'fork' not in multiprocessing.get_all_start_methods():
+            try:
+                actual, self.memory_profile = _call_case(solution_function, inputs, profile_path)
+                return None, actual, None
+            except MemoryError:
+                return MEMORY_LIMIT_EXCEEDED, None, None
+            except Exception as e:
+                return RUNTIME_ERROR, None, (str(e), traceback.format_exc())
+        
+        # Fork so the child inherits the loaded solution without pickling it
+        context = multiprocessing.get_context('fork')
+        reader, writer = context.Pipe(duplex=False)
+        process = context.Process(
+            target=_execute_limited,
+            args=(writer, solution_function, inputs, self.time_limit, self.memory_limit_mb, profile_path)
+        )
+        process.start()
+        writer.close()
+        
+        try:
+            if not reader.poll(self.time_limit):
+                return TIME_LIMIT_EXCEEDED, None, None
+            status, payload = reader.recv()
+        except EOFError:
+            # The child died without reporting back, e.g. killed by RLIMIT_CPU
+            process.join()
+            cpu_limit_signals = (getattr(signal, 'SIGXCPU', None), getattr(signal, 'SIGKILL', None))
+            if process.exitcode is not None and -process.exitcode in cpu_limit_signals:
+                return TIME_LIMIT_EXCEEDED, None, None
+            return RUNTIME_ERROR, None, (f"Process exited with code {process.exitcode}", "")
+        finally:
+            reader.close()
+            if process.is_alive():
+                process.kill()
+            process.join()
+        
+        if status == 'ok':
+            actual, self.memory_profile = payload
+            return None, actual, None
+        elif status == 'mle':
+            return MEMORY_LIMIT_EXCEEDED, None, None
+        return RUNTIME_ERROR, None, payload
+    
+    @staticmethod
+    def _print_memory_profile(memory_profile):
+        """Print the peak memory and largest allocation sites of a test case"""
+        if memory_profile is None:
+            return
+        print(f"  Memory: peak {_format_bytes(memory_profile['peak_bytes'])}, "
+              f"{memory_profile['allocations']} allocations "
+              f"({_format_bytes(memory_profile['allocated_bytes'])}) alive in the solution at return")
+        for filename, lineno, size, count in memory_profile['top_sites']:
+            print(f"    {filename}:{lineno}: {_format_bytes(size)} in {count} blocks")
+    
+    def cache_key(self, test_cases):
+        """
+        Return the verdict cache key of the solution: a hash of its source, its
+        test cases, the limits and the tester version
+        
+        Returns:
+            str: The key, or None if the test cases have no stable representation
+        """
+        cases = repr(test_cases)
+        # Objects without a __repr__ print their address, which changes on every run
+        if ' at 0x' in cases:
+            return None
+        try:
+            with open(self.solution_file_path, 'rb') as f:
+                source = f.read()
+        except OSError:
+            return None
+        digest = hashlib.sha256()
+        digest.update(json.dumps([TESTER_VERSION, self.time_limit, self.memory_limit_mb]).encode())
+        digest.update(hashlib.sha256(source).digest())
+        digest.update(cases.encode('utf-8', errors='backslashreplace'))
+        return digest.hexdigest()
+    
+    def _report_cached(self, entry):
+        """Print the verdicts of an unchanged solution from the verdict cache"""
+        self.verdicts = entry['verdicts']
+        print(f"\n{os.path.basename(self.solution_file_path)} is unchanged since its last run, "
+              f"reusing its verdicts (--force to rerun)")
+        for i, verdict in enumerate(self.verdicts):
+            if verdict != ACCEPTED:
+                print(f"Test {i+1}: {verdict}")
+        passed = self.verdicts.count(ACCEPTED)
+        print(f"\nTest Results: {passed} passed, {len(self.verdicts) - passed} failed (cached)")
+    
+    def run_tests(self, verdict_cache=None, force=False):
+        """
+        Run the tests from the solution module
+        
+        Args:
+            verdict_cache (VerdictCache): Cache to reuse and record verdicts in (None to disable)
+            force (bool): Run the tests even if the cache has verdicts for the solution
+        """
+        if not self.solution_instance:
+            print("No solution instance available")
             return False
             
-        test_cases = self.solution_instance.get_test_cases()
+        test_cases = self.get_test_cases()
         if not test_cases:
             print("No test cases provided")
             return False
             
         # Get the solution function
-        # Try to automatically detect the solution function
-        solution_functions = [attr for attr in dir(self.solution_instance) 
-                             if callable(getattr(self.solution_instance, attr)) and 
-                             not attr.startswith('_') and 
-                             attr != 'get_test_cases']
-        
-        if not solution_functions:
-            print("No solution function found")
+        solution_function = self.get_solution_function()
+        if solution_function is None:
             return False
-            
-        solution_function_name = solution_functions[0]
-        solution_function = getattr(self.solution_instance, solution_function_name)
+        
+        # Memory profiles aren't cached, so profiling always runs the tests
+        self.from_cache = False
+        cache_key = None
+        if verdict_cache is not None and not self.profile_memory:
+            cache_key = self.cache_key(test_cases)
+            entry = verdict_cache.get(self.solution_file_path, cache_key) if cache_key and not force else None
+            if entry is not None:
+                self._report_cached(entry)
+                self.from_cache = True
+                return entry['passed']
         
         # Run the tests
         passed = 0
         failed = 0
+        self.verdicts = []
+        self.memory_profiles = []
         
         print(f"\nRunning tests for {os.path.basename(self.solution_file_path)}...")
         for i, (inputs, expected) in enumerate(test_cases):
-            try:
-                # Handle different types of inputs (single value or list of values)
-                if isinstance(inputs, tuple):
-                    actual = solution_function(*inputs)
-                elif isinstance(inputs, list) and all(isinstance(x, dict) for x in inputs):
-                    # Special case for LeetCode-style list of objects
-                    actual = solution_function(inputs)
-                else:
-                    actual = solution_function(inputs)
-                
-                if actual == expected:
-                    print(f"Test {i+1}: ✓")
-                    passed += 1
-                else:
-                    print(f"Test {i+1}: ✗")
-                    print(f"  Input: {inputs}")
-                    print(f"  Expected: {expected}")
-                    print(f"  Actual: {actual}")
-                    failed += 1
-            except Exception as e:
-                print(f"Test {i+1}: Error - {e}")
-                traceback.print_exc()
-                failed += 1
+            verdict, actual, error = self.run_case(solution_function, inputs)
+            if verdict is None:
+                verdict = ACCEPTED if actual == expected else WRONG_ANSWER
+            self.verdicts.append(verdict)
+            self.memory_profiles.append(self.memory_profile)
+            
+            if verdict == ACCEPTED:
+                print(f"Test {i+1}: ✓")
+                self._print_memory_profile(self.memory_profile)
+                passed += 1
+                continue
+            
+            if verdict == WRONG_ANSWER:
+                print(f"Test {i+1}: ✗")
+                print(f"  Input: {inputs}")
+                print(f"  Expected: {expected}")
+                print(f"  Actual: {actual}")
+                self._print_memory_profile(self.memory_profile)
+            elif verdict == TIME_LIMIT_EXCEEDED:
+                print(f"Test {i+1}: TLE - exceeded the {self.time_limit}s time limit")
+                print(f"  Input: {inputs}")
+            elif verdict == MEMORY_LIMIT_EXCEEDED:
+                limit = f"the {self.memory_limit_mb} MB" if self.memory_limit_mb else "available"
+                print(f"Test {i+1}: MLE - exceeded {limit} memory")
+                print(f"  Input: {inputs}")
+            else:
+                message, error_traceback = error
+                print(f"Test {i+1}: Error - {message}")
+                print(error_traceback, file=sys.stderr, end='')
+            failed += 1
                 
         print(f"\nTest Results: {passed} passed, {failed} failed")
-        return failed == 0
\ No newline at end of file
+        if cache_key:
+            verdict_cache.put(self.solution_file_path, cache_key, failed == 0, self.verdicts)
+        return failed == 0
+
+def run_solution_file(solution_file_path, time_limit=None, memory_limit_mb=None, verdict_cache_dir=None,
+                      force=False):
+    """
+    Run the tests of a single solution file, capturing everything it prints.
+
+    Used as the worker function for parallel test runs, so it must stay at
+    module level to be picklable by a process pool.
+
+    Args:
+        solution_file_path (str): Path to the solution file
+        time_limit (float): Wall-clock limit per test case in seconds
+        memory_limit_mb (int): Extra address space allowed per test case in MB
+        verdict_cache_dir (str): Directory of the verdict cache (None to disable)
+        force (bool): Run the tests even if their verdicts are cached
+
+    Returns:
+        tuple: (solution_file_path, passed, from_cache, captured_output)
+    """
+    output = io.StringIO()
+    from_cache = False
+    with redirect_stdout(output), redirect_stderr(output):
+        try:
+            tester = SolutionTester(solution_file_path, time_limit, memory_limit_mb)
+            verdict_cache = VerdictCache(verdict_cache_dir) if verdict_cache_dir else None
+            passed = tester.run_tests(verdict_cache, force)
+            from_cache = tester.from_cache
+        except Exception:
+            traceback.print_exc()
+            passed = False
+    return solution_file_path, passed, from_cache, output.getvalue()
@@ -1,6 +1,134 @@
 import re
 import json
 import ast
+from html.parser import HTMLParser
+
+# Tags that end a line of text, so labels and values never run across them
+BLOCK_TAGS = {'p', 'div', 'pre', 'li', 'ul', 'ol', 'br', 'table', 'tr', 'h1', 'h2', 'h3', 'h4', 'img'}
+
+# Labels of the example sections, the text up to the next label or line end is the value
+_LABEL = re.compile(r'\b(Input|Output|Explanation)\s*:', re.IGNORECASE)
+
+
+class _TextFlattener(HTMLParser):
+    """
+    Turn a description into plain text with one line per block
+
+    Tags are dropped and entities unescaped. Line breaks in the source only
+    count inside <pre>, elsewhere they are whitespace, as in a browser.
+    """
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self.pre_depth = 0
+    
+    def handle_starttag(self, tag, attrs):
+        if tag == 'pre':
+            self.pre_depth += 1
+        if tag in BLOCK_TAGS:
+            self.parts.append('\n')
+    
+    def handle_startendtag(self, tag, attrs):
+        if tag in BLOCK_TAGS:
+            self.parts.append('\n')
+    
+    def handle_endtag(self, tag):
+        if tag == 'pre' and self.pre_depth:
+            self.pre_depth -= 1
+        if tag in BLOCK_TAGS:
+            self.parts.append('\n')
+    
+    def handle_data(self, data):
+        self.parts.append(data if self.pre_depth else data.replace('\n', ' '))
+
+
+def _labelled_values(text):
+    """Yield (label, value) for every Input/Output/Explanation label in the text, in order"""
+    for line in text.split('\n'):
+        labels = list(_LABEL.finditer(line))
+        for i, label in enumerate(labels):
+            end = labels[i + 1].start() if i + 1 < len(labels) else len(line)
+            value = line[label.end():end].strip()
+            if value:
+                yield label.group(1).lower(), value
+
+
+# Runs of text that can't end a value: ordinary characters and complete quoted strings.
+# At depth 0 commas stop the run, inside brackets only brackets do, so a whole
+# array of numbers or strings is skipped by one regex match.
+_STRINGS = r'"[^"\\]*(?:\\.[^"\\]*)*"|\'[^\'\\]*(?:\\.[^\'\\]*)*\''
+_TOP_LEVEL_RUN = re.compile(rf'(?:[^"\'\[\]{{}}(),]+|{_STRINGS})*')
+_NESTED_RUN = re.compile(rf'(?:[^"\'\[\]{{}}()]+|{_STRINGS})*')
+
+# A leading `name =` of a named input, but not `==`
+_ASSIGNMENT = re.compile(r'\s*[A-Za-z_]\w*\s*=(?!=)')
+
+# First characters of values that json.loads may parse
+_JSON_START = set('[{"-0123456789tfn')
+
+# Commas that may separate named inputs, the ones followed by `name =`
+_NAMED_SEPARATOR = re.compile(r',\s*(?=[A-Za-z_]\w*\s*=(?!=))')
+
+
+def _parse_named_json(text):
+    """
+    Fast path for `name = value, ...` inputs whose values are all JSON, such as numeric arrays
+
+    The text is split at every comma followed by `name =`, and each value is
+    handed to json.loads, which parses it in C. A split inside a string or an
+    array leaves a piece that isn't valid JSON, so any failure returns None
+    and the caller falls back to the tokenizer.
+
+    Returns:
+        tuple: The parsed values, or None if the fast path doesn't apply
+    """
+    values = []
+    for piece in _NAMED_SEPARATOR.split(text):
+        assignment = _ASSIGNMENT.match(piece)
+        if not assignment:
+            return None
+        value = piece[assignment.end():].strip()
+        if value[:1] not in _JSON_START:
+            return None
+        try:
+            values.append(json.loads(value))
+        except ValueError:
+            return None
+    return tuple(values)
+
+
+def _split_top_level(text):
+    """
+    Split text on the commas outside strings, brackets and braces, in linear time
+
+    Returns:
+        list: The stripped parts, empty ones included
+    """
+    parts = []
+    part_start = 0
+    depth = 0
+    i = 0
+    n = len(text)
+    while True:
+        i = (_NESTED_RUN if depth else _TOP_LEVEL_RUN).match(text, i).end()
+        if i >= n:
+            break
+        char = text[i]
+        if char in '"\'':
+            # A quote the run stopped at starts a string that is never closed
+            break
+        if char in '[{(':
+            depth += 1
+        elif char in ']})':
+            depth = max(depth - 1, 0)
+        else:
+            parts.append(text[part_start:i].strip())
+            part_start = i + 1
+        i += 1
+    parts.append(text[part_start:].strip())
+    return parts
+
 
 class TestCaseGenerator:
     """
@@ -12,103 +140,74 @@ class TestCaseGenerator:
         """
         Extract examples from a problem description
         
+        Handles both LeetCode markups, the older <pre> blocks with
+        <strong>Input:</strong> labels and the newer example blocks with the
+        values in <span class="example-io">, as well as plain text. The
+        description is parsed once and entities such as &quot; are unescaped.
+        
         Args:
             description (str): The problem description containing examples
             
         Returns:
             list: List of examples with inputs and outputs
         """
-        examples = []
-        
-        # Look for input/output patterns in the description
-        input_pattern = r"<strong>Input:</strong>.*?</strong>"
-        output_pattern = r"<strong>Output:</strong>.*?</strong>"
-        
-        # Alternative patterns
-        alt_input_pattern = r"Input:.*?\n"
-        alt_output_pattern = r"Output:.*?\n"
+        description = description or ''
+        # Only the examples section is parsed, the statement and constraints carry most of the markup
+        start = max(description.find('Example'), 0)
+        end = description.rfind('Constraints')
+        flattener = _TextFlattener()
+        flattener.feed(description[start:end] if end > start else description[start:])
+        flattener.close()
         
-        # Try to find matches using regex patterns
-        input_matches = re.findall(input_pattern, description) or re.findall(alt_input_pattern, description)
-        output_matches = re.findall(output_pattern, description) or re.findall(alt_output_pattern, description)
-        
-        # Extract input and output values
-        for i, (input_match, output_match) in enumerate(zip(input_matches, output_matches)):
-            try:
-                # Extract the input values
-                input_text = input_match.split("Input:")[1].strip()
-                
-                # Extract the output values
-                output_text = output_match.split("Output:")[1].strip()
-                
-                # Clean up the values (remove HTML tags)
-                input_text = re.sub(r"<.*?>", "", input_text).strip()
-                output_text = re.sub(r"<.*?>", "", output_text).strip()
-                
-                # Convert to Python literals safely
+        examples = []
+        pending_input = None
+        for label, value in _labelled_values(''.join(flattener.parts)):
+            if label == 'input':
+                # An input without an output before it is dropped, so pairs never shift
+                pending_input = value
+            elif label == 'output' and pending_input is not None:
                 examples.append({
-                    'input': input_text,
-                    'output': output_text
+                    'input': pending_input,
+                    'output': value
                 })
-            except Exception as e:
-                print(f"Error parsing example {i+1}: {e}")
+                pending_input = None
         
         return examples
     
     @staticmethod
     def parse_input_string(input_str):
         """
-        Parse an input string into Python objects
+        Parse an input string such as `nums = [2,7,11,15], target = 9` into Python objects
+        
+        The string is split on top-level commas in a single pass, so commas
+        inside strings, brackets and braces don't split a value.
         
         Args:
             input_str (str): The input string to parse
             
         Returns:
-            tuple: The parsed input values
+            tuple: The parsed input values, or the value itself for a single unnamed value
         """
         try:
-            # Try to identify array or numeric patterns
-            # Look for array pattern [x,y,z]
-            array_match = re.search(r'\[.*?\]', input_str)
+            values = _parse_named_json(input_str)
+            if values is not None:
+                return values
             
-            # Look for multiple inputs separated by commas
-            if ',' in input_str:
-                # Split by commas outside of brackets
-                parts = []
-                current_part = ""
-                bracket_count = 0
-                
-                for char in input_str:
-                    if char == '[':
-                        bracket_count += 1
-                        current_part += char
-                    elif char == ']':
-                        bracket_count -= 1
-                        current_part += char
-                    elif char == ',' and bracket_count == 0:
-                        parts.append(current_part.strip())
-                        current_part = ""
-                    else:
-                        current_part += char
-                
-                if current_part:
-                    parts.append(current_part.strip())
-                
-                # Parse each part
-                parsed_parts = []
-                for part in parts:
-                    # Check if it looks like a variable assignment
-                    if '=' in part:
-                        var_name, var_value = part.split('=', 1)
-                        parsed_value = TestCaseGenerator.parse_single_value(var_value.strip())
-                        parsed_parts.append(parsed_value)
-                    else:
-                        parsed_parts.append(TestCaseGenerator.parse_single_value(part))
-                
-                return tuple(parsed_parts)
-            else:
+            parts = _split_top_level(input_str)
+            parsed_parts = []
+            named = False
+            for part in parts:
+                # Check if it looks like a variable assignment
+                assignment = _ASSIGNMENT.match(part)
+                if assignment:
+                    named = True
+                    part = part[assignment.end():]
+                parsed_parts.append(TestCaseGenerator.parse_single_value(part))
+            
+            if len(parsed_parts) == 1 and not named:
                 # Single input
-                return TestCaseGenerator.parse_single_value(input_str)
+                return parsed_parts[0]
+            return tuple(parsed_parts)
         except Exception as e:
             print(f"Error parsing input: {e}")
             return input_str
@@ -124,13 +223,21 @@ class TestCaseGenerator:
         Returns:
             object: The parsed value
         """
+        value_str = value_str.strip()
+        # Fast path: arrays, numbers, strings and true/false/null are valid JSON,
+        # which json parses in C, far faster than ast.literal_eval on large inputs
+        if value_str[:1] in _JSON_START:
+            try:
+                return json.loads(value_str)
+            except ValueError:
+                pass
         try:
             # Try to use ast.literal_eval for safe parsing
             parsed = ast.literal_eval(value_str)
             return parsed
         except (SyntaxError, ValueError):
             # If literal_eval fails, return the string as is
-            return value_str.strip()
+            return value_str
     
     @staticmethod
     def parse_output_string(output_str):
@@ -169,6 +276,24 @@ class TestCaseGenerator:
         
         return test_cases
     
+    @staticmethod
+    def generate_test_cases_batch(descriptions):
+        """
+        Generate test cases for many problems at once
+        
+        Args:
+            descriptions (dict): Problem slug -> description HTML
+            
+        Returns:
+            dict: Problem slug -> list of test cases, for the problems with examples
+        """
+        test_cases = {}
+        for slug, description in descriptions.items():
+            cases = TestCaseGenerator.generate_test_cases_from_description(description)
+            if cases:
+                test_cases[slug] = cases
+        return test_cases
+    
     @staticmethod
     def add_edge_cases(test_cases, problem_type):
         """
@@ -0,0 +1,101 @@
+import os
+import io
+import json
+import socket
+import socketserver
+import traceback
+from contextlib import redirect_stdout, redirect_stderr
+
+
+class TestDaemon(socketserver.UnixStreamServer):
+    """
+    Long-lived server that keeps the tracker's modules loaded and answers
+    requests from the CLI over a Unix socket
+
+    A request is a single line of JSON such as {"command": "test", "path": "..."}.
+    The response is a single JSON object with everything the command printed
+    and its result. Requests are handled one at a time, which keeps capturing
+    stdout safe.
+    """
+
+    def __init__(self, socket_path, handler):
+        """
+        Args:
+            socket_path (str): Path of the Unix socket to listen on
+            handler (callable): Called with each request dict, returns a JSON-serializable result
+        """
+        self.socket_path = socket_path
+        self.handler = handler
+        self.shutdown_requested = False
+        if os.path.exists(socket_path):
+            # A stale socket left behind by a daemon that did not shut down cleanly
+            os.remove(socket_path)
+        super().__init__(socket_path, _DaemonRequestHandler)
+
+    def serve(self):
+        """Handle requests until a shutdown request arrives"""
+        print(f"Test daemon listening on {self.socket_path}")
+        try:
+            while not self.shutdown_requested:
+                self.handle_request()
+        finally:
+            self.server_close()
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+
+class _DaemonRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+        except ValueError as e:
+            self._respond({'output': f"Invalid request: {e}\n", 'result': None})
+            return
+
+        if request.get('command') == 'shutdown':
+            self._respond({'output': "Daemon shutting down\n", 'result': True})
+            self.server.shutdown_requested = True
+            return
+
+        output = io.StringIO()
+        result = None
+        with redirect_stdout(output), redirect_stderr(output):
+            try:
+                result = self.server.handler(request)
+            except Exception:
+                traceback.print_exc()
+        self._respond({'output': output.getvalue(), 'result': result})
+
+    def _respond(self, response):
+        self.wfile.write(json.dumps(response).encode() + b'\n')
+
+
+def request_daemon(socket_path, request, timeout=None):
+    """
+    Send a request to a running daemon
+
+    Args:
+        socket_path (str): Path of the daemon's Unix socket
+        request (dict): The request to send
+        timeout (float): Seconds to wait for the response (None to wait forever)
+
+    Returns:
+        dict: The daemon's response, or None if no daemon is running
+    """
+    if not hasattr(socket, 'AF_UNIX') or not os.path.exists(socket_path):
+        return None
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        try:
+            client.connect(socket_path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            return None
+
+        client.sendall(json.dumps(request).encode() + b'\n')
+        with client.makefile('rb') as response:
+            line = response.readline()
+    return json.loads(line) if line else None
@@ -0,0 +1,51 @@
+import os
+import json
+import hashlib
+
+from src.utils.file_modes import write_atomic
+
+
+class VerdictCache:
+    """
+    Persistent cache of test verdicts, one small JSON file per solution file
+
+    Each entry holds the key the verdict was computed under (see
+    SolutionTester.cache_key) and the verdicts of its test cases. A lookup
+    only returns the entry when the key still matches, so editing a solution,
+    its test cases or the tester invalidates it. Keeping one entry per file
+    bounds the cache to the number of solution files, and lets parallel test
+    workers write their entries without coordinating.
+    """
+
+    def __init__(self, cache_dir):
+        """
+        Args:
+            cache_dir (str): Directory holding the cached verdicts
+        """
+        self.cache_dir = cache_dir
+
+    def _path(self, solution_path):
+        name = hashlib.sha256(os.path.abspath(solution_path).encode()).hexdigest()[:32]
+        return os.path.join(self.cache_dir, f"{name}.json")
+
+    def get(self, solution_path, key):
+        """Return the cached entry of a solution file, or None if there is none for this key"""
+        try:
+            with open(self._path(solution_path), 'r') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return entry if entry.get('key') == key else None
+
+    def put(self, solution_path, key, passed, verdicts):
+        """
+        Store the verdicts of a solution file, replacing the file atomically
+
+        Args:
+            solution_path (str): Path to the solution file
+            key (str): Key the verdicts were computed under
+            passed (bool): Whether every test case passed
+            verdicts (list): Verdict of each test case
+        """
+        entry = {'key': key, 'path': os.path.abspath(solution_path), 'passed': passed, 'verdicts': verdicts}
+        write_atomic(self._path(solution_path), json.dumps(entry))